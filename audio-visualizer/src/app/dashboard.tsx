@@ -3,8 +3,8 @@
 // DTO ADDITION REQUIRED — add this block to src/core/dto.types.ts:
 //
 //   melSpectrogram: {
-//     raw:     number[];  // 40 mel-band energy values (linear or dB)
-//     clean:   number[];  // 40 mel-band energy values
+//     raw:     ArrayLike<number>; // 40 mel-band energy values (linear or dB)
+//     clean:   ArrayLike<number>; // 40 mel-band energy values
 //     melBins: number;    // 40
 //     fMin:    number;    // lowest mel freq (Hz)  — e.g. 20
 //     fMax:    number;    // highest mel freq (Hz) — e.g. 8000
@@ -23,7 +23,8 @@ import { VADHistoryRenderer } from '../features/vad-history/vad-history.renderer
 import { MetricsPanel } from '../features/metrics/metrics.component';
 import { MelSpectrogramRenderer } from '../features/mel-spectrogram/mel-spectrogram.renderer';
 
-const WS_URL = 'ws://localhost:8080/visualizer';
+// Binary (MessagePack) frames; the server falls back to JSON without msgpack
+const WS_URL = 'ws://localhost:8080/visualizer?format=binary';
 
 export const AudioDashboard: React.FC = () => {
   // ── canvas refs ──────────────────────────────────────────────────────────
@@ -42,6 +43,8 @@ export const AudioDashboard: React.FC = () => {
   const melRawRenderer     = useRef<MelSpectrogramRenderer | null>(null);
   const melCleanRenderer   = useRef<MelSpectrogramRenderer | null>(null);
   const wsService          = useRef<WebSocketService | null>(null);
+  const latestDto          = useRef<VisualizationDTO | null>(null);
+  const dirty              = useRef(false);
 
   const [connected, setConnected] = useState(false);
   const [dto, setDto]     = useState<VisualizationDTO | null>(null);
@@ -73,6 +76,21 @@ export const AudioDashboard: React.FC = () => {
       melCleanRenderer.current = new MelSpectrogramRenderer(melCleanRef.current, {
         melBins: 40, historyFrames: 200, isLogScaled: true,
       });
+
+    // Canvas bitmaps are only reallocated on real layout changes
+    const resizeObserver = new ResizeObserver(() => {
+      waveformRenderer.current?.resize();
+      spectrumRenderer.current?.resize();
+      barkBandsRenderer.current?.resize();
+      vadHistoryRenderer.current?.resize();
+      melRawRenderer.current?.resize();
+      melCleanRenderer.current?.resize();
+      dirty.current = true;
+    });
+    [waveformRef, spectrumRef, barkBandsRef, vadHistoryRef, melRawRef, melCleanRef]
+      .forEach(ref => ref.current && resizeObserver.observe(ref.current));
+
+    return () => resizeObserver.disconnect();
   }, []);
 
   // ── sync gain / auto-scale to waveform renderer ───────────────────────────
@@ -80,6 +98,7 @@ export const AudioDashboard: React.FC = () => {
     if (waveformRenderer.current) {
       waveformRenderer.current.setGain(gain);
       waveformRenderer.current.setAutoScale(autoScale);
+      dirty.current = true;
     }
   }, [gain, autoScale]);
 
@@ -88,7 +107,10 @@ export const AudioDashboard: React.FC = () => {
     wsService.current = new WebSocketService(
       WS_URL,
       (newDto) => {
-        setDto(newDto);
+        // Only stash the DTO here; the rAF loop draws (and re-renders React)
+        // at most once per display frame, however fast messages arrive.
+        latestDto.current = newDto;
+        dirty.current = true;
         vadHistoryRenderer.current?.addValue(newDto.vad);
 
         // Feed mel frames as they arrive (outside rAF loop for accurate timing)
@@ -110,31 +132,37 @@ export const AudioDashboard: React.FC = () => {
     let animationId: number;
 
     const render = () => {
-      if (dto) {
+      const latest = latestDto.current;
+      if (dirty.current && latest) {
+        dirty.current = false;
+
         waveformRenderer.current?.render(
-          dto.waveform.raw, dto.waveform.clean,
-          dto.waveform.sampleRate, dto.waveform.durationMs,
+          latest.waveform.raw, latest.waveform.clean,
+          latest.waveform.sampleRate, latest.waveform.durationMs,
+          latest.waveform.envelope,
         );
         spectrumRenderer.current?.render(
-          dto.spectrum.raw, dto.spectrum.clean,
-          dto.spectrum.frequencies, dto.waveform.sampleRate, dto.spectrum.fftSize,
+          latest.spectrum.raw, latest.spectrum.clean,
+          latest.spectrum.frequencies, latest.waveform.sampleRate, latest.spectrum.fftSize,
         );
         barkBandsRenderer.current?.render(
-          dto.barkBands.raw, dto.barkBands.clean,
-          dto.barkBands.bandEdges, dto.waveform.sampleRate,
+          latest.barkBands.raw, latest.barkBands.clean,
+          latest.barkBands.bandEdges, latest.waveform.sampleRate,
         );
         vadHistoryRenderer.current?.render();
 
-        // Mel spectrograms: render every frame (data is pushed in WS callback)
+        // Mel spectrograms: data is pushed in the WS callback
         melRawRenderer.current?.render('RAW MEL');
         melCleanRenderer.current?.render('CLEAN MEL');
+
+        setDto(latest);
       }
       animationId = requestAnimationFrame(render);
     };
 
-    render();
+    animationId = requestAnimationFrame(render);
     return () => cancelAnimationFrame(animationId);
-  }, [dto]);
+  }, []);
 
   // ── helpers ───────────────────────────────────────────────────────────────
   const sampleRate = dto?.waveform?.sampleRate ?? 48000;
@@ -0,0 +1,162 @@
+// src/core/binary-dto.ts
+//
+// Decoder for /visualizer?format=binary frames.
+//
+// The server sends the v2 DTO as MessagePack; every NumPy array is an
+// envelope {"__nd__": true, dtype, shape, data: <bin>} whose bytes are
+// viewed directly as a typed array (no per-sample text parsing) and handed
+// to the renderers as-is — no boxing back into number[].
+// Quantized fields are expanded back to the units the renderers expect:
+//   - spectrum / barkBands : float16 log1p  → expm1(x), as Float32Array
+//   - melSpectrogram       : uint8 codes    → q * dbStep + dbFloor (dB), as Float32Array
+//   - waveform             : int16 [min, max] pairs; envelope/decimation are
+//                            passed through so the renderer draws bars
+import { VisualizationDTO } from './dto.types';
+
+type NdArray = Int16Array | Int32Array | Uint8Array | Float32Array | Float64Array | Uint16Array;
+
+const textDecoder = new TextDecoder();
+
+// ── Minimal MessagePack reader (maps, arrays, str, bin, ints, floats) ───────
+class MsgpackReader {
+  private view: DataView;
+  private bytes: Uint8Array;
+  private pos = 0;
+
+  constructor(buffer: ArrayBuffer) {
+    this.view = new DataView(buffer);
+    this.bytes = new Uint8Array(buffer);
+  }
+
+  read(): any {
+    const b = this.view.getUint8(this.pos++);
+
+    if (b <= 0x7f) return b;                               // positive fixint
+    if (b >= 0xe0) return b - 0x100;                       // negative fixint
+    if ((b & 0xf0) === 0x80) return this.readMap(b & 0x0f);
+    if ((b & 0xf0) === 0x90) return this.readArray(b & 0x0f);
+    if ((b & 0xe0) === 0xa0) return this.readStr(b & 0x1f);
+
+    switch (b) {
+      case 0xc0: return null;
+      case 0xc2: return false;
+      case 0xc3: return true;
+      case 0xc4: return this.readBin(this.u8());
+      case 0xc5: return this.readBin(this.u16());
+      case 0xc6: return this.readBin(this.u32());
+      case 0xca: { const v = this.view.getFloat32(this.pos); this.pos += 4; return v; }
+      case 0xcb: { const v = this.view.getFloat64(this.pos); this.pos += 8; return v; }
+      case 0xcc: return this.u8();
+      case 0xcd: return this.u16();
+      case 0xce: return this.u32();
+      case 0xcf: { const v = Number(this.view.getBigUint64(this.pos)); this.pos += 8; return v; }
+      case 0xd0: { const v = this.view.getInt8(this.pos); this.pos += 1; return v; }
+      case 0xd1: { const v = this.view.getInt16(this.pos); this.pos += 2; return v; }
+      case 0xd2: { const v = this.view.getInt32(this.pos); this.pos += 4; return v; }
+      case 0xd3: { const v = Number(this.view.getBigInt64(this.pos)); this.pos += 8; return v; }
+      case 0xd9: return this.readStr(this.u8());
+      case 0xda: return this.readStr(this.u16());
+      case 0xdb: return this.readStr(this.u32());
+      case 0xdc: return this.readArray(this.u16());
+      case 0xdd: return this.readArray(this.u32());
+      case 0xde: return this.readMap(this.u16());
+      case 0xdf: return this.readMap(this.u32());
+      default:
+        throw new Error(`Unsupported msgpack type 0x${b.toString(16)}`);
+    }
+  }
+
+  private u8(): number { return this.view.getUint8(this.pos++); }
+  private u16(): number { const v = this.view.getUint16(this.pos); this.pos += 2; return v; }
+  private u32(): number { const v = this.view.getUint32(this.pos); this.pos += 4; return v; }
+
+  private readStr(len: number): string {
+    const s = textDecoder.decode(this.bytes.subarray(this.pos, this.pos + len));
+    this.pos += len;
+    return s;
+  }
+
+  private readBin(len: number): Uint8Array {
+    // Copy so the typed-array view below starts on an aligned offset
+    const out = this.bytes.slice(this.pos, this.pos + len);
+    this.pos += len;
+    return out;
+  }
+
+  private readArray(len: number): any[] {
+    const out = new Array(len);
+    for (let i = 0; i < len; i++) out[i] = this.read();
+    return out;
+  }
+
+  private readMap(len: number): Record<string, any> {
+    const out: Record<string, any> = {};
+    for (let i = 0; i < len; i++) {
+      const key = this.read();
+      const value = this.read();
+      out[key] = value?.__nd__ ? toTypedArray(value) : value;
+    }
+    return out;
+  }
+}
+
+// ── ndarray envelopes ───────────────────────────────────────────────────────
+function toTypedArray(nd: { dtype: string; data: Uint8Array }): NdArray {
+  const buf = nd.data.buffer;
+  switch (nd.dtype) {
+    case '<i2': return new Int16Array(buf);
+    case '<i4': return new Int32Array(buf);
+    case '<i8': return Float64Array.from(new BigInt64Array(buf), Number);   // e.g. bandEdges
+    case '|u1': return nd.data;
+    case '<f2': return new Uint16Array(buf);   // raw half-float bits, see halfToFloat
+    case '<f4': return new Float32Array(buf);
+    case '<f8': return new Float64Array(buf);
+    default:
+      throw new Error(`Unsupported ndarray dtype ${nd.dtype}`);
+  }
+}
+
+function halfToFloat(h: number): number {
+  const exp = (h >> 10) & 0x1f;
+  const frac = h & 0x03ff;
+  const sign = h & 0x8000 ? -1 : 1;
+  if (exp === 0) return sign * frac * 2 ** -24;
+  if (exp === 0x1f) return frac ? NaN : sign * Infinity;
+  return sign * (1 + frac / 1024) * 2 ** (exp - 15);
+}
+
+function expandLog1p(a: NdArray): Float32Array {
+  const out = new Float32Array(a.length);
+  const isHalf = a instanceof Uint16Array;
+  for (let i = 0; i < a.length; i++) {
+    out[i] = Math.expm1(isHalf ? halfToFloat(a[i]) : a[i]);
+  }
+  return out;
+}
+
+function expandMelDb(a: NdArray, dbFloor: number, dbStep: number): Float32Array {
+  const out = new Float32Array(a.length);
+  for (let i = 0; i < a.length; i++) out[i] = a[i] * dbStep + dbFloor;
+  return out;
+}
+
+/** Decode one binary frame into the same shape as the JSON v2 DTO. */
+export function decodeBinaryDto(buffer: ArrayBuffer): VisualizationDTO {
+  const d = new MsgpackReader(buffer).read();
+
+  // waveform, spectrum.frequencies and barkBands.bandEdges stay as the
+  // typed-array views built by toTypedArray — renderers take ArrayLike<number>
+  d.spectrum.raw = expandLog1p(d.spectrum.raw);
+  d.spectrum.clean = expandLog1p(d.spectrum.clean);
+
+  d.barkBands.raw = expandLog1p(d.barkBands.raw);
+  d.barkBands.clean = expandLog1p(d.barkBands.clean);
+
+  if (d.melSpectrogram) {
+    const { dbFloor, dbStep } = d.melSpectrogram;
+    d.melSpectrogram.raw = expandMelDb(d.melSpectrogram.raw, dbFloor, dbStep);
+    d.melSpectrogram.clean = expandMelDb(d.melSpectrogram.clean, dbFloor, dbStep);
+  }
+
+  return d as VisualizationDTO;
+}
@@ -0,0 +1,26 @@
+// src/core/canvas.utils.ts
+
+/**
+ * Match a canvas backing store to its CSS box × devicePixelRatio.
+ *
+ * The bitmap is only reallocated when the size actually changed — assigning
+ * canvas.width/height clears the canvas and resets the context state, so this
+ * must not run per frame. Returns the logical (CSS pixel) size to draw in.
+ */
+export function fitCanvas(
+  canvas: HTMLCanvasElement,
+  ctx: CanvasRenderingContext2D
+): { width: number; height: number } {
+  const dpr = window.devicePixelRatio || 1;
+  const rect = canvas.getBoundingClientRect();
+  const w = Math.round(rect.width * dpr);
+  const h = Math.round(rect.height * dpr);
+
+  if (rect.width > 0 && (canvas.width !== w || canvas.height !== h)) {
+    canvas.width = w;
+    canvas.height = h;
+    // Absolute transform: never compounds, whatever state the context was in
+    ctx.setTransform(dpr, 0, 0, dpr, 0, 0);
+  }
+  return { width: rect.width, height: rect.height };
+}
@@ -1,22 +1,24 @@
 export interface WaveformDTO {
-  raw: number[];
-  clean: number[];
+  raw: ArrayLike<number>;
+  clean: ArrayLike<number>;
   sampleRate: number;   // 48000
   durationMs: number;   // 40
+  envelope?: 'minmax';  // binary stream only: raw/clean are [min, max] pairs
+  decimation?: number;  // input samples per value (each [min, max] pair spans 2 × decimation samples)
 }
 
 export interface SpectrumDTO {
-  raw: number[];
-  clean: number[];
-  frequencies: number[];
+  raw: ArrayLike<number>;
+  clean: ArrayLike<number>;
+  frequencies: ArrayLike<number>;
   fftSize: number;
   hopLength: number;
 }
 
 export interface BarkBandsDTO {
-  raw: number[];
-  clean: number[];
-  bandEdges: number[];
+  raw: ArrayLike<number>;
+  clean: ArrayLike<number>;
+  bandEdges: ArrayLike<number>;
 }
 
 export interface SystemDTO {
@@ -48,23 +50,27 @@ export interface VisualizationDTO {
 /** Time-domain waveform data — 4 RNNoise frames (480 samples each) per batch. */
 export interface WaveformData {
   /** 1920 int16 samples (4 × 480) — raw input from ESP32. */
-  raw: number[];
+  raw: ArrayLike<number>;
   /** 1920 int16 samples after RNNoise denoising. */
-  clean: number[];
+  clean: ArrayLike<number>;
   /** Always 48000 Hz — fixed by RNNoise requirement. */
   sampleRate: number;
   /** Always 40ms — 4 frames × 10ms. */
   durationMs: number;
+  /** Binary stream only — raw/clean are interleaved [min, max] pairs. */
+  envelope?: 'minmax';
+  /** Binary stream only — input samples per value (each [min, max] pair spans 2 × decimation samples). */
+  decimation?: number;
 }
 
 /** Frequency-domain spectrum — FFT-512 applied to each batch. */
 export interface SpectrumData {
   /** 257 float magnitudes (rfft output, 0 → Nyquist) — raw input. */
-  raw: number[];
+  raw: ArrayLike<number>;
   /** 257 float magnitudes after RNNoise denoising. */
-  clean: number[];
+  clean: ArrayLike<number>;
   /** 257 frequency bin center values in Hz (0 → 24000). */
-  frequencies: number[];
+  frequencies: ArrayLike<number>;
   /** FFT window size — always 512. */
   fftSize: number;
   /** Hop length — always 256. */
@@ -74,11 +80,11 @@ export interface SpectrumData {
 /** Psychoacoustic Bark-scale band energies. */
 export interface BarkBandsData {
   /** 24 band energy values — raw input. */
-  raw: number[];
+  raw: ArrayLike<number>;
   /** 24 band energy values after RNNoise denoising. */
-  clean: number[];
+  clean: ArrayLike<number>;
   /** 25 frequency boundaries in Hz defining the 24 band edges. */
-  bandEdges: number[];
+  bandEdges: ArrayLike<number>;
 }
 
 /**
@@ -90,9 +96,9 @@ export interface BarkBandsData {
  */
 export interface MelSpectrogramData {
   /** 40 log-mel band energy values in dB — raw input. */
-  raw: number[];
+  raw: ArrayLike<number>;
   /** 40 log-mel band energy values in dB after RNNoise denoising. */
-  clean: number[];
+  clean: ArrayLike<number>;
   /** Number of mel bins — always 40. */
   melBins: number;
   /** Lowest frequency of the mel filterbank in Hz — e.g. 20. */
@@ -1,4 +1,5 @@
 import { VisualizationDTO } from "./dto.types";
+import { decodeBinaryDto } from "./binary-dto";
 
 // src/core/websocket.service.ts
 export class WebSocketService {
@@ -23,6 +24,8 @@ export class WebSocketService {
   connect(): void {
     try {
       this.ws = new WebSocket(this.url);
+      // ?format=binary streams arrive as MessagePack ArrayBuffers
+      this.ws.binaryType = 'arraybuffer';
 
       this.ws.onopen = () => {
         console.log('WebSocket connected to visualizer');
@@ -35,7 +38,9 @@ export class WebSocketService {
 
       this.ws.onmessage = (event) => {
         try {
-          const dto: VisualizationDTO = JSON.parse(event.data);
+          const dto: VisualizationDTO = typeof event.data === 'string'
+            ? JSON.parse(event.data)
+            : decodeBinaryDto(event.data);
           this.latestDto = dto;
           this.onMessage(dto);
         } catch (err) {
@@ -1,27 +1,33 @@
+import { fitCanvas } from '../../core/canvas.utils';
+
 export class BarkBandsRenderer {
   private canvas: HTMLCanvasElement;
   private ctx: CanvasRenderingContext2D;
-  private width: number;
-  private height: number;
+  private width = 0;
+  private height = 0;
   private sampleRate: number = 48000;
 
+  // Grid geometry only changes with the canvas size — stroke a cached Path2D
+  private gridPath: Path2D | null = null;
+  private gridKey = '';
+
   constructor(canvas: HTMLCanvasElement) {
     this.canvas = canvas;
     this.ctx = canvas.getContext('2d')!;
+    this.resize();
+  }
 
-    const dpr = window.devicePixelRatio || 1;
-    const rect = canvas.getBoundingClientRect();
-    canvas.width = rect.width * dpr;
-    canvas.height = rect.height * dpr;
-    this.ctx.scale(dpr, dpr);
-    this.width = rect.width;
-    this.height = rect.height;
+  /** Re-measure the canvas; call when its layout size changes. */
+  resize(): void {
+    const { width, height } = fitCanvas(this.canvas, this.ctx);
+    this.width = width;
+    this.height = height;
   }
 
   render(
-    rawBands: number[],
-    cleanBands: number[],
-    bandEdges: number[],
+    rawBands: ArrayLike<number>,
+    cleanBands: ArrayLike<number>,
+    bandEdges: ArrayLike<number>,
     sampleRate: number = 48000
   ): void {
     this.sampleRate = sampleRate;
@@ -33,18 +39,26 @@ export class BarkBandsRenderer {
     this.drawLegend(sampleRate, bandEdges);
   }
 
-  private drawGrid(bandEdges: number[]): void {
+  private drawGrid(bandEdges: ArrayLike<number>): void {
+    const key = `${this.width}x${this.height}/${bandEdges.length}`;
+    if (!this.gridPath || this.gridKey !== key) {
+      const path = new Path2D();
+      // Show every 5th band boundary
+      for (let i = 0; i < bandEdges.length; i += 5) {
+        const x = (i / (bandEdges.length - 1)) * this.width;
+        path.moveTo(x, 0);
+        path.lineTo(x, this.height);
+      }
+      this.gridPath = path;
+      this.gridKey = key;
+    }
+
     this.ctx.strokeStyle = '#1a1a1a';
     this.ctx.lineWidth = 1;
+    this.ctx.stroke(this.gridPath);
 
-    // Show every 5th band boundary
     for (let i = 0; i < bandEdges.length; i += 5) {
       const x = (i / (bandEdges.length - 1)) * this.width;
-      this.ctx.beginPath();
-      this.ctx.moveTo(x, 0);
-      this.ctx.lineTo(x, this.height);
-      this.ctx.stroke();
-
       if (i < bandEdges.length - 1) {
         this.ctx.fillStyle = '#555';
         this.ctx.font = '9px monospace';
@@ -53,11 +67,14 @@ export class BarkBandsRenderer {
     }
   }
 
-  private drawBars(bands: number[], color: string, alpha: number): void {
+  private drawBars(bands: ArrayLike<number>, color: string, alpha: number): void {
     if (!bands || bands.length === 0) return;
 
     const barWidth = this.width / bands.length;
-    const maxVal = Math.max(...bands, 1);
+    let maxVal = 1;
+    for (let i = 0; i < bands.length; i++) {
+      if (bands[i] > maxVal) maxVal = bands[i];
+    }
 
     this.ctx.fillStyle = color;
     this.ctx.globalAlpha = alpha;
@@ -76,7 +93,7 @@ export class BarkBandsRenderer {
     this.ctx.globalAlpha = 1.0;
   }
 
-  private drawLegend(sampleRate: number, bandEdges: number[]): void {
+  private drawLegend(sampleRate: number, bandEdges: ArrayLike<number>): void {
     // Background
     this.ctx.fillStyle = 'rgba(0,0,0,0.8)';
     this.ctx.fillRect(10, 10, 200, 55);
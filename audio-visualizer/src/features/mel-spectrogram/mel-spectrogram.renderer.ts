@@ -9,6 +9,8 @@
  *  - History:    200 frames ≈ 8 seconds at 25 Hz
  */
 
+import { fitCanvas } from '../../core/canvas.utils';
+
 export type MelChannel = 'raw' | 'clean';
 
 // ---------------------------------------------------------------------------
@@ -52,6 +54,10 @@ export class MelSpectrogramRenderer {
   private readonly offCtx: CanvasRenderingContext2D;
   private imageData: ImageData;
 
+  // Logical (CSS pixel) canvas size, refreshed by resize()
+  private width = 0;
+  private height = 0;
+
   private readonly MEL_BINS: number;
   private readonly HISTORY: number;
   private readonly isLogScaled: boolean; // true if server already sends dB
@@ -99,7 +105,7 @@ export class MelSpectrogramRenderer {
     this.offCtx = this.offscreen.getContext('2d')!;
     this.imageData = this.offCtx.createImageData(this.HISTORY, this.MEL_BINS);
 
-    this.initCanvas();
+    this.resize();
   }
 
   // -------------------------------------------------------------------------
@@ -107,7 +113,7 @@ export class MelSpectrogramRenderer {
   // -------------------------------------------------------------------------
 
   /** Feed one frame of mel energies (length = MEL_BINS). */
-  addFrame(melData: number[]): void {
+  addFrame(melData: ArrayLike<number>): void {
     const base = this.writeHead * this.MEL_BINS;
     for (let i = 0; i < this.MEL_BINS; i++) {
       const raw = melData[i] ?? 0;
@@ -122,11 +128,8 @@ export class MelSpectrogramRenderer {
 
   /** Render the spectrogram onto the canvas.  Call from rAF loop. */
   render(label = ''): void {
-    this.syncCanvasSize();
-
-    const dpr  = window.devicePixelRatio || 1;
-    const W    = this.canvas.width  / dpr;
-    const H    = this.canvas.height / dpr;
+    const W = this.width;
+    const H = this.height;
 
     // ---- 1. Fill offscreen ImageData (HISTORY × MEL_BINS pixels) ----------
     const pixels = this.imageData.data;
@@ -221,35 +224,15 @@ export class MelSpectrogramRenderer {
 
   /** Call on canvas resize events. */
   resize(): void {
-    this.initCanvas();
+    const { width, height } = fitCanvas(this.canvas, this.ctx);
+    this.width = width;
+    this.height = height;
   }
 
   // -------------------------------------------------------------------------
   // Private helpers
   // -------------------------------------------------------------------------
 
-  private initCanvas(): void {
-    const dpr  = window.devicePixelRatio || 1;
-    const rect = this.canvas.getBoundingClientRect();
-    const w    = Math.round((rect.width  || 600) * dpr);
-    const h    = Math.round((rect.height || 160) * dpr);
-    if (this.canvas.width !== w || this.canvas.height !== h) {
-      this.canvas.width  = w;
-      this.canvas.height = h;
-    }
-  }
-
-  private syncCanvasSize(): void {
-    const dpr  = window.devicePixelRatio || 1;
-    const rect = this.canvas.getBoundingClientRect();
-    const w    = Math.round(rect.width  * dpr);
-    const h    = Math.round(rect.height * dpr);
-    if (rect.width > 0 && (this.canvas.width !== w || this.canvas.height !== h)) {
-      this.canvas.width  = w;
-      this.canvas.height = h;
-    }
-  }
-
   private drawColorbar(H: number): void {
     const barW = 6;
     const barH = H * 0.6;
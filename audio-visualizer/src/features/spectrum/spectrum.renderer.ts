@@ -1,26 +1,33 @@
+import { fitCanvas } from '../../core/canvas.utils';
+
 export class SpectrumRenderer {
   private canvas: HTMLCanvasElement;
   private ctx: CanvasRenderingContext2D;
-  private width: number;
-  private height: number;
+  private width = 0;
+  private height = 0;
   private sampleRate: number = 48000;
 
+  // Grid geometry only changes with the canvas size / Nyquist — stroke a cached Path2D
+  private gridPath: Path2D | null = null;
+  private gridKey = '';
+
   constructor(canvas: HTMLCanvasElement) {
     this.canvas = canvas;
     this.ctx = canvas.getContext('2d')!;
-    const dpr = window.devicePixelRatio || 1;
-    const rect = canvas.getBoundingClientRect();
-    canvas.width = rect.width * dpr;
-    canvas.height = rect.height * dpr;
-    this.ctx.scale(dpr, dpr);
-    this.width = rect.width;
-    this.height = rect.height;
+    this.resize();
+  }
+
+  /** Re-measure the canvas; call when its layout size changes. */
+  resize(): void {
+    const { width, height } = fitCanvas(this.canvas, this.ctx);
+    this.width = width;
+    this.height = height;
   }
 
   render(
-    rawSpectrum: number[],
-    cleanSpectrum: number[],
-    frequencies: number[],
+    rawSpectrum: ArrayLike<number>,
+    cleanSpectrum: ArrayLike<number>,
+    frequencies: ArrayLike<number>,
     sampleRate: number = 48000,
     fftSize: number = 512
   ): void {
@@ -34,14 +41,33 @@ export class SpectrumRenderer {
     this.drawLegend(sampleRate, fftSize, nyquist);
   }
 
-  private drawGrid(frequencies: number[], nyquist: number): void {
-    this.ctx.strokeStyle = '#222';
-    this.ctx.lineWidth = 1;
-
+  private drawGrid(frequencies: ArrayLike<number>, nyquist: number): void {
     // Vertical grid lines + frequency labels
     const freqMarkers = [0, 2000, 4000, 6000, 8000, 10000, 12000, 14000, 16000, 18000, 20000, 22000, 24000]
       .filter(f => f <= nyquist);
 
+    const key = `${this.width}x${this.height}@${nyquist}`;
+    if (!this.gridPath || this.gridKey !== key) {
+      const path = new Path2D();
+      freqMarkers.forEach(freq => {
+        const x = (freq / nyquist) * this.width;
+        path.moveTo(x, 0);
+        path.lineTo(x, this.height);
+      });
+      // Horizontal grid lines (rough dB reference)
+      for (let i = 1; i < 6; i++) {
+        const y = (this.height / 5) * i;
+        path.moveTo(0, y);
+        path.lineTo(this.width, y);
+      }
+      this.gridPath = path;
+      this.gridKey = key;
+    }
+
+    this.ctx.strokeStyle = '#222';
+    this.ctx.lineWidth = 1;
+    this.ctx.stroke(this.gridPath);
+
     this.ctx.font = 'bold 12px monospace';  // Larger + bold
     this.ctx.fillStyle = '#ffffff';         // Bright white
     this.ctx.shadowColor = 'rgba(0,0,0,0.9)'; // Strong dark shadow/glow
@@ -51,11 +77,6 @@ export class SpectrumRenderer {
 
     freqMarkers.forEach(freq => {
       const x = (freq / nyquist) * this.width;
-      // Grid line
-      this.ctx.beginPath();
-      this.ctx.moveTo(x, 0);
-      this.ctx.lineTo(x, this.height);
-      this.ctx.stroke();
 
       // Label
       const label = `${(freq / 1000).toFixed(0)}k`;
@@ -72,20 +93,11 @@ export class SpectrumRenderer {
     // Reset shadow to avoid affecting other elements
     this.ctx.shadowColor = 'transparent';
     this.ctx.shadowBlur = 0;
-
-    // Horizontal grid lines (rough dB reference)
-    for (let i = 1; i < 6; i++) {
-      const y = (this.height / 5) * i;
-      this.ctx.beginPath();
-      this.ctx.moveTo(0, y);
-      this.ctx.lineTo(this.width, y);
-      this.ctx.stroke();
-    }
   }
 
   private drawSpectrumBars(
-    spectrum: number[],
-    frequencies: number[],
+    spectrum: ArrayLike<number>,
+    frequencies: ArrayLike<number>,
     nyquist: number,
     color: string,
     alpha: number,
@@ -94,9 +106,14 @@ export class SpectrumRenderer {
     if (!spectrum || spectrum.length === 0) return;
 
     // Better dB normalization (shared range feel, floor at -100 dB-ish)
-    const dbs = spectrum.map(m => 20 * Math.log10(Math.max(m, 1e-10)));
-    const minDb = Math.min(...dbs, -100) - 5; // slight buffer
-    const maxDb = Math.max(...dbs, 0);
+    let minDb = -100;
+    let maxDb = 0;
+    for (let i = 0; i < spectrum.length; i++) {
+      const db = 20 * Math.log10(Math.max(spectrum[i], 1e-10));
+      if (db < minDb) minDb = db;
+      if (db > maxDb) maxDb = db;
+    }
+    minDb -= 5; // slight buffer
     const dbRange = maxDb - minDb || 100;
 
     this.ctx.globalAlpha = alpha;
@@ -1,30 +1,34 @@
 // src/features/vad-history/vad-history.renderer.ts
+import { fitCanvas } from '../../core/canvas.utils';
 export class VADHistoryRenderer {
   private canvas: HTMLCanvasElement;
   private ctx: CanvasRenderingContext2D;
-  private width: number;
-  private height: number;
-  private history: number[] = [];
+  private width = 0;
+  private height = 0;
   private readonly maxHistory = 100;
 
+  // Ring buffer: Float32Array[maxHistory] (same layout as the mel renderer)
+  private readonly history = new Float32Array(this.maxHistory);
+  private writeHead = 0;
+  private filled = 0;
+
   constructor(canvas: HTMLCanvasElement) {
     this.canvas = canvas;
     this.ctx = canvas.getContext('2d')!;
+    this.resize();
+  }
 
-    const dpr = window.devicePixelRatio || 1;
-    const rect = canvas.getBoundingClientRect();
-    canvas.width = rect.width * dpr;
-    canvas.height = rect.height * dpr;
-    this.ctx.scale(dpr, dpr);
-    this.width = rect.width;
-    this.height = rect.height;
+  /** Re-measure the canvas; call when its layout size changes. */
+  resize(): void {
+    const { width, height } = fitCanvas(this.canvas, this.ctx);
+    this.width = width;
+    this.height = height;
   }
 
   addValue(vad: number): void {
-    this.history.push(vad);
-    if (this.history.length > this.maxHistory) {
-      this.history.shift();
-    }
+    this.history[this.writeHead] = vad;
+    this.writeHead = (this.writeHead + 1) % this.maxHistory;
+    if (this.filled < this.maxHistory) this.filled++;
   }
 
   render(): void {
@@ -33,7 +37,10 @@ export class VADHistoryRenderer {
     this.ctx.fillStyle = '#0a0a0a';
     this.ctx.fillRect(0, 0, this.width, this.height);
 
-    if (this.history.length < 2) return;
+    const filled = this.filled;
+    if (filled < 2) return;
+    // Oldest sample sits at writeHead once the ring has wrapped
+    const start = filled < this.maxHistory ? 0 : this.writeHead;
 
     const thresholdY = this.height * 0.5;
     this.ctx.strokeStyle = '#444';
@@ -50,9 +57,11 @@ export class VADHistoryRenderer {
 
     const step = this.width / (this.maxHistory - 1);
 
-    for (let i = 0; i < this.history.length; i++) {
+    let lastVal = 0;
+    for (let i = 0; i < filled; i++) {
+      lastVal = this.history[(start + i) % this.maxHistory];
       const x = i * step;
-      const y = this.height - (this.history[i] * this.height);
+      const y = this.height - (lastVal * this.height);
 
       if (i === 0) {
         this.ctx.moveTo(x, y);
@@ -63,22 +72,19 @@ export class VADHistoryRenderer {
 
     this.ctx.stroke();
 
-    this.ctx.lineTo((this.history.length - 1) * step, this.height);
+    this.ctx.lineTo((filled - 1) * step, this.height);
     this.ctx.lineTo(0, this.height);
     this.ctx.closePath();
     this.ctx.fillStyle = 'rgba(0, 170, 255, 0.2)';
     this.ctx.fill();
 
-    if (this.history.length > 0) {
-      const lastVal = this.history[this.history.length - 1];
-      const lastX = (this.history.length - 1) * step;
-      const lastY = this.height - (lastVal * this.height);
+    const lastX = (filled - 1) * step;
+    const lastY = this.height - (lastVal * this.height);
 
-      this.ctx.fillStyle = lastVal > 0.5 ? '#00ff88' : '#ff4444';
-      this.ctx.beginPath();
-      this.ctx.arc(lastX, lastY, 4, 0, Math.PI * 2);
-      this.ctx.fill();
-    }
+    this.ctx.fillStyle = lastVal > 0.5 ? '#00ff88' : '#ff4444';
+    this.ctx.beginPath();
+    this.ctx.arc(lastX, lastY, 4, 0, Math.PI * 2);
+    this.ctx.fill();
 
     this.ctx.fillStyle = '#666';
     this.ctx.font = '10px monospace';
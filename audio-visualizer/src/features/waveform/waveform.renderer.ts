@@ -1,25 +1,31 @@
+import { fitCanvas } from '../../core/canvas.utils';
+
 export class WaveformRenderer {
   private canvas: HTMLCanvasElement;
   private ctx: CanvasRenderingContext2D;
-  private width: number;
-  private height: number;
+  private width = 0;
+  private height = 0;
   private gain: number = 1.0;
   private autoScale: boolean = true;
   private currentScale: number = 1.0;
   private lastPeak: number = 0;
   private sampleRate: number = 48000; // Store fs for display
 
+  // Grid geometry only changes with the canvas size — stroke a cached Path2D
+  private gridPath: Path2D | null = null;
+  private gridKey = '';
+
   constructor(canvas: HTMLCanvasElement) {
     this.canvas = canvas;
     this.ctx = canvas.getContext('2d')!;
+    this.resize();
+  }
 
-    const dpr = window.devicePixelRatio || 1;
-    const rect = canvas.getBoundingClientRect();
-    canvas.width = rect.width * dpr;
-    canvas.height = rect.height * dpr;
-    this.ctx.scale(dpr, dpr);
-    this.width = rect.width;
-    this.height = rect.height;
+  /** Re-measure the canvas; call when its layout size changes. */
+  resize(): void {
+    const { width, height } = fitCanvas(this.canvas, this.ctx);
+    this.width = width;
+    this.height = height;
   }
 
   setGain(gain: number): void {
@@ -31,16 +37,16 @@ export class WaveformRenderer {
   }
 
   render(
-    rawWaveform: number[],
-    cleanWaveform: number[],
+    rawWaveform: ArrayLike<number>,
+    cleanWaveform: ArrayLike<number>,
     sampleRate: number = 48000,
-    durationMs: number = 40
+    durationMs: number = 40,
+    envelope?: 'minmax'
   ): void {
     this.sampleRate = sampleRate;
     this.ctx.clearRect(0, 0, this.width, this.height);
 
-    const allSamples = [...rawWaveform, ...cleanWaveform];
-    const peak = Math.max(...allSamples.map(Math.abs), 1);
+    const peak = Math.max(this.absPeak(rawWaveform), this.absPeak(cleanWaveform), 1);
     this.lastPeak = peak;
 
     if (this.autoScale) {
@@ -53,35 +59,56 @@ export class WaveformRenderer {
 
     this.drawGrid(sampleRate, durationMs);
     this.drawCenterLine();
-    this.drawWaveformLine(rawWaveform, '#ff4444', 0.5, 2, this.currentScale);
-    this.drawWaveformLine(cleanWaveform, '#00ff88', 1.0, 2.5, this.currentScale);
+    if (envelope === 'minmax') {
+      this.drawEnvelope(rawWaveform, '#ff4444', 0.5, 2, this.currentScale);
+      this.drawEnvelope(cleanWaveform, '#00ff88', 1.0, 2.5, this.currentScale);
+    } else {
+      this.drawWaveformLine(rawWaveform, '#ff4444', 0.5, 2, this.currentScale);
+      this.drawWaveformLine(cleanWaveform, '#00ff88', 1.0, 2.5, this.currentScale);
+    }
     this.drawLegend();
     this.drawScaleInfo(peak, this.currentScale, sampleRate, durationMs);
     this.drawAxisLabels(sampleRate, durationMs);
   }
 
+  /** Largest |sample|; plain indexed loop, no spread / map temporaries. */
+  private absPeak(data: ArrayLike<number>): number {
+    let peak = 0;
+    for (let i = 0, n = data.length; i < n; i++) {
+      const v = data[i];
+      const a = v < 0 ? -v : v;
+      peak = a > peak ? a : peak;
+    }
+    return peak;
+  }
+
   private drawGrid(sampleRate: number, durationMs: number): void {
-    this.ctx.strokeStyle = '#1a1a1a';
-    this.ctx.lineWidth = 1;
+    const key = `${this.width}x${this.height}`;
+    if (!this.gridPath || this.gridKey !== key) {
+      const path = new Path2D();
+
+      // Time divisions based on actual duration
+      const divisions = 4;
+      for (let i = 1; i < divisions; i++) {
+        const x = (this.width / divisions) * i;
+        path.moveTo(x, 0);
+        path.lineTo(x, this.height);
+      }
+
+      // Amplitude divisions
+      [0.25, 0.75].forEach(pct => {
+        const y = this.height * pct;
+        path.moveTo(0, y);
+        path.lineTo(this.width, y);
+      });
 
-    // Time divisions based on actual duration
-    const divisions = 4;
-    for (let i = 1; i < divisions; i++) {
-      const x = (this.width / divisions) * i;
-      this.ctx.beginPath();
-      this.ctx.moveTo(x, 0);
-      this.ctx.lineTo(x, this.height);
-      this.ctx.stroke();
+      this.gridPath = path;
+      this.gridKey = key;
     }
 
-    // Amplitude divisions
-    [0.25, 0.75].forEach(pct => {
-      const y = this.height * pct;
-      this.ctx.beginPath();
-      this.ctx.moveTo(0, y);
-      this.ctx.lineTo(this.width, y);
-      this.ctx.stroke();
-    });
+    this.ctx.strokeStyle = '#1a1a1a';
+    this.ctx.lineWidth = 1;
+    this.ctx.stroke(this.gridPath);
   }
 
   private drawCenterLine(): void {
@@ -96,7 +123,7 @@ export class WaveformRenderer {
   }
 
   private drawWaveformLine(
-    data: number[],
+    data: ArrayLike<number>,
     color: string,
     alpha: number,
     lineWidth: number,
@@ -111,16 +138,20 @@ export class WaveformRenderer {
     this.ctx.lineCap = 'round';
     this.ctx.beginPath();
 
-    const step = this.width / data.length;
+    // Raw JSON samples only (envelope pairs go through drawEnvelope): at most
+    // one point per CSS pixel, striding with an integer index
+    const points = Math.min(data.length, Math.max(2, Math.floor(this.width)));
+    const stride = data.length / points;
+    const step = this.width / points;
     const centerY = this.height / 2;
     const amplitudeScale = (this.height / 2) * 0.45;
 
     let lastX = 0;
     let lastY = centerY;
 
-    for (let i = 0; i < data.length; i++) {
+    for (let i = 0; i < points; i++) {
       const x = i * step;
-      const normalized = (data[i] / 32768) * scale;
+      const normalized = (data[(i * stride) | 0] / 32768) * scale;
       const clamped = Math.max(-1, Math.min(1, normalized));
       const y = centerY - (clamped * amplitudeScale);
 
@@ -141,6 +172,58 @@ export class WaveformRenderer {
     this.ctx.globalAlpha = 1.0;
   }
 
+  /**
+   * Binary stream: data is interleaved [min, max] pairs. Draw one vertical
+   * min→max segment per pair — no smoothing, which would pull the extremes
+   * towards the midpoints and halve the visible amplitude.
+   */
+  private drawEnvelope(
+    data: ArrayLike<number>,
+    color: string,
+    alpha: number,
+    lineWidth: number,
+    scale: number
+  ): void {
+    const pairs = data ? data.length >> 1 : 0;
+    if (pairs === 0) return;
+
+    this.ctx.strokeStyle = color;
+    this.ctx.globalAlpha = alpha;
+    this.ctx.lineWidth = lineWidth;
+    this.ctx.lineCap = 'round';
+    this.ctx.beginPath();
+
+    // Step in whole pairs; when there are more pairs than pixels, fold each
+    // pixel's pairs together (min of mins, max of maxes) so no peak is lost
+    const columns = Math.min(pairs, Math.max(2, Math.floor(this.width)));
+    const perColumn = pairs / columns;
+    const step = this.width / columns;
+    const centerY = this.height / 2;
+    const amplitudeScale = (this.height / 2) * 0.45;
+    const toY = (v: number) =>
+      centerY - Math.max(-1, Math.min(1, (v / 32768) * scale)) * amplitudeScale;
+
+    for (let c = 0; c < columns; c++) {
+      const start = (c * perColumn) | 0;
+      const end = Math.max(start + 1, ((c + 1) * perColumn) | 0);
+      let lo = data[2 * start];
+      let hi = data[2 * start + 1];
+      for (let p = start + 1; p < end; p++) {
+        const pMin = data[2 * p];
+        const pMax = data[2 * p + 1];
+        lo = pMin < lo ? pMin : lo;
+        hi = pMax > hi ? pMax : hi;
+      }
+
+      const x = c * step;
+      this.ctx.moveTo(x, toY(lo));
+      this.ctx.lineTo(x, toY(hi));
+    }
+
+    this.ctx.stroke();
+    this.ctx.globalAlpha = 1.0;
+  }
+
   private drawLegend(): void {
     const legendY = 25;
     this.ctx.font = '12px monospace';
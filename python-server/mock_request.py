@@ -1,8 +1,14 @@
 # Add near the top
+import base64
 import json
 
+import numpy as np
+
 # Inside handle_client, after parsing (e.g. after print(...))
 # For quick test: echo back some dummy data
+# Waveforms go out as base64 little-endian int16 instead of per-sample JSON numbers.
+# JS side: new Int16Array(Uint8Array.from(atob(s), c => c.charCodeAt(0)).buffer)
+raw_b64 = base64.b64encode(np.asarray(raw_pcm, dtype='<i2').tobytes()).decode('ascii')
 dummy_dto = {
     "batchSeq": batch_seq,
     "latencyMs": 42,
@@ -11,8 +17,8 @@ dummy_dto = {
     "packetLoss": 0,
     "rawSpectrum": [0.1] * 257,      # fake array
     "cleanSpectrum": [0.05] * 257,
-    "rawWaveform": raw_pcm.tolist(), # convert tuple → list
-    "cleanWaveform": raw_pcm.tolist() # fake same as raw for now
+    "rawWaveformB64": raw_b64,
+    "cleanWaveformB64": raw_b64      # fake same as raw for now
 }
 
 await websocket.send(json.dumps(dummy_dto))
@@ -5,13 +5,42 @@ import struct
 import time
 import math
 import json
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
 import numpy as np
 from scipy.fft import rfft
-from dataclasses import dataclass, asdict, field
-from typing import Set, List, Optional, Dict, Any
+from dataclasses import dataclass, field
+from typing import Set, List, Optional, Dict, Any, Tuple, Callable
 from collections import deque
+from bisect import bisect_right
 import logging
 
+try:
+    import pyfftw  # Optional: pre-planned FFTW transforms for compute_stft
+except ImportError:
+    pyfftw = None
+
+try:
+    import orjson  # Optional: C-level JSON encoding of DTOs incl. NumPy arrays
+except ImportError:
+    orjson = None
+
+try:
+    import msgpack  # Optional: binary DTO frames for /visualizer?format=binary
+except ImportError:
+    msgpack = None
+
+try:
+    from numba import njit  # Optional: JIT-compiled DSP kernels
+except ImportError:
+    njit = None
+
+try:
+    import uvloop  # Optional: libuv event loop (not available on Windows)
+except ImportError:
+    uvloop = None
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -36,25 +65,183 @@ MEL_FMIN = 20.0     # Hz
 MEL_FMAX = 8000.0   # Hz
 MEL_TOP_DB = 80.0   # dB floor (librosa default: top_db=80 → range −80 to 0 dB)
 
+# Binary (msgpack) payload quantization — see VisualizationDTOv2.to_binary_dict
+BINARY_WAVEFORM_DECIMATION = 4           # 1920 → 480 display samples per batch (240 min/max pairs)
+BINARY_MEL_DB_STEP = MEL_TOP_DB / 255.0  # uint8 code → dB: q * step − top_db
+
+# Backpressure: a visualizer whose socket write buffer holds more than this
+# skips batches until it drains (~a few v2 JSON frames)
+SLOW_CLIENT_BUFFER_BYTES = 256 * 1024
+
+# FFTW wisdom cache — lets pyFFTW skip FFTW_MEASURE planning across restarts
+FFTW_WISDOM_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".fftw_wisdom.json")
+
 # Struct formats
 HEADER_FORMAT = "<IB3sII"
+HEADER_STRUCT = struct.Struct(HEADER_FORMAT)  # compiled once, unpacked in place
 FRAME_FORMAT = f"<Iff{SAMPLES_PER_FRAME}h{SAMPLES_PER_FRAME}h"
+PCM_DTYPE = np.dtype('<i2')
+
+# One ESP32 audio frame as a packed NumPy record (same layout as FRAME_FORMAT,
+# itemsize == AUDIO_FRAME_SIZE)
+FRAME_DTYPE = np.dtype([
+    ('seq', '<u4'),
+    ('vad', '<f4'),
+    ('rms', '<f4'),
+    ('raw', PCM_DTYPE, (SAMPLES_PER_FRAME,)),
+    ('clean', PCM_DTYPE, (SAMPLES_PER_FRAME,)),
+])
+
+# DTOs are rebuilt every batch; __slots__ drops the per-instance __dict__
+# (dataclass slots need Python 3.10+; on 3.9, the oldest version websockets 14
+# supports, the DTOs stay plain classes)
+_DATACLASS_SLOTS: Dict[str, bool] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+def _empty_array() -> np.ndarray:
+    return np.empty(0, dtype=np.float32)
+
+
+def _json_default(obj: Any) -> Any:
+    """JSON fallback for NumPy values (non-contiguous arrays, scalars)"""
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    if isinstance(obj, np.generic):
+        return obj.item()
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+def encode_json(payload: Dict[str, Any]) -> bytes:
+    """
+    Serialize a DTO dict to JSON.
+
+    Always returns UTF-8 bytes, so each payload is encoded once and
+    websockets.broadcast reuses the same buffer for every client. With orjson,
+    NumPy arrays are written straight from their buffers; otherwise falls back
+    to stdlib json.
+    """
+    if orjson is not None:
+        return orjson.dumps(payload, default=_json_default, option=orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(payload, default=_json_default).encode('utf-8')
+
+
+def _msgpack_default(obj: Any) -> Any:
+    """
+    msgpack hook for NumPy values.
+
+    Arrays become {"__nd__": True, "dtype": "<f4", "shape": [...], "data": <bin>},
+    so clients can wrap `data` directly in a typed array (e.g. Float32Array).
+    """
+    if isinstance(obj, np.ndarray):
+        arr = np.ascontiguousarray(obj)
+        return {"__nd__": True, "dtype": arr.dtype.str, "shape": list(arr.shape), "data": arr.tobytes()}
+    if isinstance(obj, np.generic):
+        return obj.item()
+    raise TypeError(f"Type is not msgpack serializable: {type(obj).__name__}")
+
+
+def encode_msgpack(payload: Dict[str, Any]) -> bytes:
+    """Serialize a DTO dict to MessagePack with NumPy arrays as raw binary"""
+    return msgpack.packb(payload, use_bin_type=True, default=_msgpack_default)
+
+
+# ============================================================================
+# JIT DSP KERNELS (used when numba is installed)
+# ============================================================================
+
+def _mel_db_kernel(power, filterbank, top_db, out):
+    """
+    Fused mel pipeline: filterbank @ power → 10·log10 → peak-normalise → floor.
 
+    Writes MEL_BINS dB values into `out`; one pass instead of six NumPy calls.
+    """
+    n_mels, n_freqs = filterbank.shape
+    peak = 0.0
+    for m in range(n_mels):
+        acc = 0.0
+        for k in range(n_freqs):
+            acc += filterbank[m, k] * power[k]
+        if acc < 1e-10:
+            acc = 1e-10
+        db = 10.0 * math.log10(acc)
+        out[m] = db
+        if m == 0 or db > peak:
+            peak = db
+    for m in range(n_mels):
+        v = out[m] - peak
+        out[m] = v if v > -top_db else -top_db
+
+
+def _snr_kernel(raw, clean):
+    """
+    Signal and noise energy of an int16 raw/clean pair in one fused pass.
+
+    Returns (sum(clean²), sum((raw − clean)²)) without temporary arrays.
+    """
+    signal = 0.0
+    noise = 0.0
+    for i in range(clean.shape[0]):
+        c = float(clean[i])
+        d = float(raw[i]) - c
+        signal += c * c
+        noise += d * d
+    return signal, noise
+
+
+def _level_kernel(pcm):
+    """
+    Peak |sample| and energy of an int16 buffer in one fused pass.
+
+    Returns (max(|pcm|), sum(pcm²)); samples are widened to float (exact for
+    int16) before negating, so -32768 does not wrap.
+    """
+    peak = 0.0
+    energy = 0.0
+    for i in range(pcm.shape[0]):
+        f = float(pcm[i])
+        a = -f if f < 0.0 else f
+        if a > peak:
+            peak = a
+        energy += f * f
+    return peak, energy
+
+
+if njit is not None:
+    _mel_db_kernel = njit(cache=True, fastmath=True, nogil=True)(_mel_db_kernel)
+    _snr_kernel = njit(cache=True, fastmath=True, nogil=True)(_snr_kernel)
+    _level_kernel = njit(cache=True, fastmath=True, nogil=True)(_level_kernel)
+else:
+    _mel_db_kernel = None
+    _snr_kernel = None
+    _level_kernel = None
+
+
+@dataclass(**_DATACLASS_SLOTS)
+class FramesBatch:
+    """
+    The FRAMES_PER_BATCH frames of one packet as structure-of-arrays.
+
+    Every field is a read-only view into the packet (no per-frame objects);
+    row i of each field belongs to frame i.
+    """
+    frame_seq: np.ndarray  # uint32, (FRAMES_PER_BATCH,)
+    vad_prob: np.ndarray   # float32, (FRAMES_PER_BATCH,)
+    rms_raw: np.ndarray    # float32, (FRAMES_PER_BATCH,)
+    raw: np.ndarray        # int16, (FRAMES_PER_BATCH, SAMPLES_PER_FRAME)
+    clean: np.ndarray      # int16, (FRAMES_PER_BATCH, SAMPLES_PER_FRAME)
 
-@dataclass
-class AudioFrame:
-    frame_seq: int
-    vad_prob: float
-    rms_raw: float
-    raw_pcm: List[int]
-    clean_pcm: List[int]
+    @classmethod
+    def from_packet(cls, message: bytes) -> "FramesBatch":
+        """Parse all frames at once with one structured np.frombuffer view"""
+        batch = np.frombuffer(message, dtype=FRAME_DTYPE, count=FRAMES_PER_BATCH, offset=BATCH_HEADER_SIZE)
+        return cls(batch['seq'], batch['vad'], batch['rms'], batch['raw'], batch['clean'])
 
 
 # ============================================================================
 # DTO VERSIONS (Backward Compatible)
 # ============================================================================
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class VisualizationDTO:
     """
     LEGACY DTO - v1.0 API (maintained for backward compatibility)
@@ -75,34 +262,34 @@ class VisualizationDTO:
     voice_detected: bool
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class WaveformData:
     """Waveform container for new DTO"""
-    raw: List[int] = field(default_factory=list)
-    clean: List[int] = field(default_factory=list)
+    raw: np.ndarray = field(default_factory=_empty_array)    # int16
+    clean: np.ndarray = field(default_factory=_empty_array)  # int16
     sampleRate: int = SAMPLE_RATE
     durationMs: int = 40
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class SpectrumData:
     """Spectrum container for new DTO"""
-    raw: List[float] = field(default_factory=list)
-    clean: List[float] = field(default_factory=list)
-    frequencies: List[float] = field(default_factory=list)
+    raw: np.ndarray = field(default_factory=_empty_array)
+    clean: np.ndarray = field(default_factory=_empty_array)
+    frequencies: np.ndarray = field(default_factory=_empty_array)
     fftSize: int = FFT_SIZE
     hopLength: int = HOP_LENGTH
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class BarkBandsData:
     """Bark psychoacoustic bands"""
-    raw: List[float] = field(default_factory=list)
-    clean: List[float] = field(default_factory=list)
-    bandEdges: List[float] = field(default_factory=list)
+    raw: np.ndarray = field(default_factory=_empty_array)
+    clean: np.ndarray = field(default_factory=_empty_array)
+    bandEdges: np.ndarray = field(default_factory=_empty_array)
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class MelSpectrogramData:
     """
     Log-mel spectrogram data (Design Doc v1.2 — Mel Spectrogram Addition)
@@ -112,14 +299,14 @@ class MelSpectrogramData:
     Frontend reads dto.melSpectrogram.raw / .clean directly — no conversion needed.
     If the server dB range changes, update DB_FLOOR / DB_CEIL in mel-spectrogram.renderer.ts.
     """
-    raw: List[float] = field(default_factory=list)    # 40 log-mel band energies in dB (raw input)
-    clean: List[float] = field(default_factory=list)  # 40 log-mel band energies in dB (denoised)
+    raw: np.ndarray = field(default_factory=_empty_array)    # 40 log-mel band energies in dB (raw input)
+    clean: np.ndarray = field(default_factory=_empty_array)  # 40 log-mel band energies in dB (denoised)
     melBins: int = MEL_BINS                            # Always 40
     fMin: float = MEL_FMIN                             # 20 Hz
     fMax: float = MEL_FMAX                             # 8000 Hz
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class SystemMetrics:
     """System-level metrics"""
     frameSeq: int = 0
@@ -127,7 +314,7 @@ class SystemMetrics:
     queueDepth: int = 4  # Fixed by design
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class VisualizationDTOv2:
     """
     ENHANCED DTO - v2.0 API (new comprehensive format)
@@ -169,10 +356,10 @@ class VisualizationDTOv2:
     peak_raw: int = field(default=0)
     rms_db: float = field(default=0.0)
     voice_detected: bool = field(default=False)
-    rawSpectrum: List[float] = field(default_factory=list)  # Alias for spectrum.raw
-    cleanSpectrum: List[float] = field(default_factory=list)  # Alias for spectrum.clean
-    rawWaveform: List[int] = field(default_factory=list)  # Alias for waveform.raw
-    cleanWaveform: List[int] = field(default_factory=list)  # Alias for waveform.clean
+    rawSpectrum: np.ndarray = field(default_factory=_empty_array)  # Alias for spectrum.raw
+    cleanSpectrum: np.ndarray = field(default_factory=_empty_array)  # Alias for spectrum.clean
+    rawWaveform: np.ndarray = field(default_factory=_empty_array)  # Alias for waveform.raw
+    cleanWaveform: np.ndarray = field(default_factory=_empty_array)  # Alias for waveform.clean
 
     def to_legacy_dict(self) -> Dict[str, Any]:
         """Convert to legacy flat format for old clients (no mel spectrogram)"""
@@ -182,10 +369,10 @@ class VisualizationDTOv2:
             "snr": self.snr,
             "vad": self.vad,
             "packetLoss": self.packetLoss,
-            "rawSpectrum": self.rawSpectrum or self.spectrum.raw,
-            "cleanSpectrum": self.cleanSpectrum or self.spectrum.clean,
-            "rawWaveform": self.rawWaveform or self.waveform.raw,
-            "cleanWaveform": self.cleanWaveform or self.waveform.clean,
+            "rawSpectrum": self.rawSpectrum if len(self.rawSpectrum) else self.spectrum.raw,
+            "cleanSpectrum": self.cleanSpectrum if len(self.cleanSpectrum) else self.spectrum.clean,
+            "rawWaveform": self.rawWaveform if len(self.rawWaveform) else self.waveform.raw,
+            "cleanWaveform": self.cleanWaveform if len(self.cleanWaveform) else self.waveform.clean,
             "timestamp": self.timestamp,
             "peak_raw": self.peak_raw,
             "rms_db": self.rms_db,
@@ -242,11 +429,76 @@ class VisualizationDTOv2:
             "voice_detected": self.voice_detected,
         }
 
+    def to_binary_dict(self, v2_dict: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        v2 structure with display-resolution arrays for binary (msgpack) clients.
+
+        - waveform.raw/clean : int16 min/max envelope, one (min, max) pair per
+                               2 × BINARY_WAVEFORM_DECIMATION samples, interleaved
+                               (waveform.decimation gives the factor)
+        - spectrum.raw/clean : float16 log1p(magnitude) → magnitude = expm1(x)
+        - barkBands.raw/clean: float16 log1p(energy)    → energy = expm1(x)
+        - melSpectrogram     : uint8 codes → dB = q * dbStep + dbFloor
+
+        `v2_dict` may be a dict already produced by to_v2_dict(); it is not modified.
+        """
+        d = dict(v2_dict if v2_dict is not None else self.to_v2_dict())
+        d["waveform"] = {
+            **d["waveform"],
+            "raw": self._minmax_envelope(self.waveform.raw),
+            "clean": self._minmax_envelope(self.waveform.clean),
+            "decimation": BINARY_WAVEFORM_DECIMATION,
+            "envelope": "minmax",
+        }
+        d["spectrum"] = {
+            **d["spectrum"],
+            "raw": np.log1p(self.spectrum.raw).astype(np.float16),
+            "clean": np.log1p(self.spectrum.clean).astype(np.float16),
+            "encoding": "log1p",
+        }
+        d["barkBands"] = {
+            **d["barkBands"],
+            "raw": np.log1p(self.barkBands.raw).astype(np.float16),
+            "clean": np.log1p(self.barkBands.clean).astype(np.float16),
+            "encoding": "log1p",
+        }
+        d["melSpectrogram"] = {
+            **d["melSpectrogram"],
+            "raw": self._quantize_mel_db(self.melSpectrogram.raw),
+            "clean": self._quantize_mel_db(self.melSpectrogram.clean),
+            "dbFloor": -MEL_TOP_DB,
+            "dbStep": BINARY_MEL_DB_STEP,
+        }
+        return d
+
+    @staticmethod
+    def _minmax_envelope(pcm: np.ndarray) -> np.ndarray:
+        """Interleaved [min, max] per block — keeps peaks that striding would skip"""
+        block = 2 * BINARY_WAVEFORM_DECIMATION
+        pcm = np.asarray(pcm)
+        blocks = pcm[:len(pcm) // block * block].reshape(-1, block)
+        envelope = np.empty((blocks.shape[0], 2), dtype=pcm.dtype)
+        blocks.min(axis=1, out=envelope[:, 0])
+        blocks.max(axis=1, out=envelope[:, 1])
+        return envelope.reshape(-1)
+
+    @staticmethod
+    def _quantize_mel_db(mel_db: np.ndarray) -> np.ndarray:
+        """Map [−top_db, 0] dB onto uint8 0..255 (≈0.31 dB per step)"""
+        codes = np.rint((np.asarray(mel_db) + MEL_TOP_DB) / BINARY_MEL_DB_STEP)
+        return np.clip(codes, 0, 255).astype(np.uint8)
+
 
 # ============================================================================
-# VOICE ACTIVITY LOGGER (Unchanged)
+# VOICE ACTIVITY LOGGER
 # ============================================================================
 
+# VAD sparkline: glyph i is used for SPARK_LEVELS[i-1] <= vad < SPARK_LEVELS[i]
+SPARK_LEVELS = (0.2, 0.4, 0.6, 0.8)
+SPARK_CHARS = ('▁', '▂', '▃', '▅', '█')
+SPARK_LENGTH = 20
+
+
 class VoiceActivityLogger:
     """Real-time voice activity logger for microphone verification"""
 
@@ -255,6 +507,8 @@ class VoiceActivityLogger:
         self.peak_history = deque(maxlen=history_size)
         self.vad_history = deque(maxlen=history_size)
         self.snr_history = deque(maxlen=history_size)
+        # Rolling sparkline: one glyph classified per batch, joined only when printed
+        self.spark_glyphs = deque(maxlen=SPARK_LENGTH)
         self.speaking_frames = 0
         self.silent_frames = 0
 
@@ -292,72 +546,91 @@ class VoiceActivityLogger:
         else:
             return f"silence ({vad_prob:.2f})"
 
-    def calculate_peak(self, pcm_samples: List[int]) -> int:
+    def calculate_peak(self, pcm_samples: np.ndarray) -> int:
         """Calculate peak amplitude"""
-        return max(abs(s) for s in pcm_samples)
+        # Two int16 reductions, no abs() temporary; -min is taken on a Python
+        # int so -(-32768) does not wrap
+        return max(int(pcm_samples.max()), -int(pcm_samples.min()))
 
-    def calculate_rms_db(self, pcm_samples: List[int]) -> float:
+    def calculate_rms_db(self, pcm_samples: np.ndarray) -> float:
         """Calculate RMS in dB"""
-        samples = np.array(pcm_samples, dtype=np.float64)
-        rms = np.sqrt(np.mean(samples ** 2))
-        if rms < 1:
+        samples = pcm_samples.astype(np.float32, copy=False)
+        # Mean square via one dot product; 10·log10(ms) == 20·log10(rms), no sqrt
+        return self._mean_square_db(float(np.dot(samples, samples)) / len(samples))
+
+    def calculate_levels(self, pcm_samples: np.ndarray) -> Tuple[int, float]:
+        """Peak amplitude and RMS in dB — one fused pass when numba is available"""
+        if _level_kernel is None:
+            return self.calculate_peak(pcm_samples), self.calculate_rms_db(pcm_samples)
+        peak, energy = _level_kernel(pcm_samples)
+        return int(peak), self._mean_square_db(energy / len(pcm_samples))
+
+    @staticmethod
+    def _mean_square_db(mean_square: float) -> float:
+        if mean_square < 1:
             return -60.0
-        return 20 * math.log10(rms)
+        return 10 * math.log10(mean_square)
 
-    def log_voice_activity(self, batch_seq: int, frames: List[AudioFrame],
-                          snr: float, packet_loss: int, num_clients: int):
-        """Log voice activity with visual feedback"""
-        last_frame = frames[-1]
-        all_raw = []
-        for f in frames:
-            all_raw.extend(f.raw_pcm)
+    def log_voice_activity(self, batch_seq: int, frames: FramesBatch,
+                          snr: float, packet_loss: int, num_clients: int,
+                          peak: Optional[int] = None, rms_db: Optional[float] = None):
+        """
+        Log voice activity with visual feedback.
 
-        peak = self.calculate_peak(all_raw)
-        rms_db = self.calculate_rms_db(all_raw)
+        Callers that already reduced the batch pass `peak` / `rms_db` so the
+        raw PCM is not concatenated and scanned a second time.
+        """
+        vad_prob = float(frames.vad_prob[-1])  # last frame of the batch
+        if peak is None or rms_db is None:
+            all_raw = frames.raw.reshape(-1)
+            peak = self.calculate_peak(all_raw)
+            rms_db = self.calculate_rms_db(all_raw)
 
         # Update history
         self.peak_history.append(peak)
-        self.vad_history.append(last_frame.vad_prob)
+        self.vad_history.append(vad_prob)
+        self.spark_glyphs.append(SPARK_CHARS[bisect_right(SPARK_LEVELS, vad_prob)])
         self.snr_history.append(snr)
 
         # Track speaking/silent frames
-        if last_frame.vad_prob > 0.5:
+        if vad_prob > 0.5:
             self.speaking_frames += 1
         else:
             self.silent_frames += 1
 
-        # Print detailed log every 10 batches (400ms)
+        # Print detailed log every 10 batches (400ms) — assembled first, then
+        # written to stdout in a single call
         if batch_seq % 10 == 0:
-            print("\n" + "="*80)
-            print(f"🎵 BATCH {batch_seq:>6} | Time: {time.strftime('%H:%M:%S')}")
-            print("="*80)
-
-            print(f"\n📊 PEAK AMPLITUDE:     {self.create_volume_bar(peak)}")
-            print(f"RMS LEVEL:          {self.create_db_bar(rms_db)}")
-            print(f"VAD PROBABILITY:    {self.create_vad_indicator(last_frame.vad_prob)}")
-            print(f"SNR:                {snr:>5.1f} dB")
+            lines = [
+                "\n" + "="*80,
+                f"🎵 BATCH {batch_seq:>6} | Time: {time.strftime('%H:%M:%S')}",
+                "="*80,
+                f"\n📊 PEAK AMPLITUDE:     {self.create_volume_bar(peak)}",
+                f"RMS LEVEL:          {self.create_db_bar(rms_db)}",
+                f"VAD PROBABILITY:    {self.create_vad_indicator(vad_prob)}",
+                f"SNR:                {snr:>5.1f} dB",
+            ]
 
             total_frames = self.speaking_frames + self.silent_frames
             if total_frames > 0:
                 speak_pct = (self.speaking_frames / total_frames) * 100
-                print(f"\nSTATS: Speaking: {self.speaking_frames} ({speak_pct:.1f}%) | "
-                      f"Silent: {self.silent_frames} | Clients: {num_clients}")
+                lines.append(f"\nSTATS: Speaking: {self.speaking_frames} ({speak_pct:.1f}%) | "
+                             f"Silent: {self.silent_frames} | Clients: {num_clients}")
 
             if len(self.vad_history) > 10:
-                recent_vad = list(self.vad_history)[-20:]
-                sparkline = ''.join(['▁' if v < 0.2 else '▂' if v < 0.4 else '▃' if v < 0.6 else '▅' if v < 0.8 else '█' for v in recent_vad])
-                print(f"\nVAD HISTORY (last 20): {sparkline}")
+                lines.append(f"\nVAD HISTORY (last {SPARK_LENGTH}): {''.join(self.spark_glyphs)}")
 
             if packet_loss > 0:
-                print(f"\nPACKET LOSS: {packet_loss} batches lost!")
+                lines.append(f"\nPACKET LOSS: {packet_loss} batches lost!")
 
-            print(f"\nMIC TEST: {'SPEAK NOW!' if last_frame.vad_prob < 0.3 else 'Voice detected ✓'}")
-            print("="*80)
+            lines.append(f"\nMIC TEST: {'SPEAK NOW!' if vad_prob < 0.3 else 'Voice detected ✓'}")
+            lines.append("="*80)
+            sys.stdout.write("\n".join(lines) + "\n")
 
         # Simple one-line log for significant activity
-        elif last_frame.vad_prob > 0.3 or peak > 5000:
+        elif vad_prob > 0.3 or peak > 5000:
             bar = self.create_volume_bar(peak, length=20)
-            vad_str = self.create_vad_indicator(last_frame.vad_prob)
+            vad_str = self.create_vad_indicator(vad_prob)
             print(f"[{batch_seq:>6}] {bar} | {vad_str} | SNR:{snr:>4.1f}dB", end='\r')
 
 
@@ -365,11 +638,20 @@ class VoiceActivityLogger:
 # ENHANCED AUDIO PROCESSING ENGINE
 # ============================================================================
 
+# (2, n_fft) float32 input buffer and the call that transforms it in place
+PairPlan = Tuple[np.ndarray, Callable[[], np.ndarray]]
+
+
 class AudioProcessingEngine:
     def __init__(self, n_fft: int = FFT_SIZE, hop_length: int = HOP_LENGTH):
         self.n_fft = n_fft
         self.hop_length = hop_length
-        self.window = np.hanning(n_fft)
+        # float32 Hann window: keeps the windowed FFT input in single precision
+        self.window = np.hanning(n_fft).astype(np.float32)
+
+        # rfft bin centre frequencies are constant — compute once, hand out read-only
+        self._rfft_freqs = np.fft.rfftfreq(n_fft, 1.0 / SAMPLE_RATE).astype(np.float32)
+        self._rfft_freqs.flags.writeable = False
 
         # Bark scale band edges (24 bands, 0-24 Bark ≈ 0-15500 Hz @ 48kHz)
         # Pre-computed for 48kHz sample rate
@@ -380,6 +662,13 @@ class AudioProcessingEngine:
         ])
         self.n_bands = len(self.bark_edges) - 1
 
+        # Bark bands are contiguous runs of rfft bins: precompute the first bin
+        # of every band (plus the end of the last) for np.add.reduceat.
+        # reduceat returns the start bin instead of 0 for an empty band, so
+        # those (possible only with a coarse n_fft) are masked out afterwards.
+        self._bark_starts = np.searchsorted(self._rfft_freqs, self.bark_edges).astype(np.intp)
+        self._bark_empty = self._bark_starts[:-1] == self._bark_starts[1:]
+
         # Pre-build mel filterbank once at startup (Design Doc v1.2)
         # Shape: (MEL_BINS, n_fft//2 + 1) — applied to rfft magnitude vectors
         self._mel_filterbank: np.ndarray = self._build_mel_filterbank(
@@ -389,11 +678,103 @@ class AudioProcessingEngine:
             fmin=MEL_FMIN,
             fmax=MEL_FMAX,
         )
+        self._mel_filterbank.flags.writeable = False
         logger.info(
             f"Mel filterbank ready: {MEL_BINS} bins, "
             f"{MEL_FMIN:.0f}–{MEL_FMAX:.0f} Hz, shape={self._mel_filterbank.shape}"
         )
 
+        # Power-spectrum scratch buffer for the JIT mel kernel; warm the JIT
+        # here so the first real batch does not pay the compile cost.
+        self._power = np.empty(n_fft // 2 + 1, dtype=np.float32)
+        if _mel_db_kernel is not None:
+            self._power.fill(0.0)
+            _mel_db_kernel(self._power, self._mel_filterbank, MEL_TOP_DB, np.empty(MEL_BINS, dtype=np.float32))
+            silence = np.frombuffer(bytes(SAMPLES_PER_FRAME * PCM_DTYPE.itemsize), dtype=PCM_DTYPE)
+            _snr_kernel(silence, silence)  # read-only, like the packet views
+            # Batch PCM is a contiguous (writable) copy of the four frame rows
+            _level_kernel(np.zeros(SAMPLES_PER_FRAME * FRAMES_PER_BATCH, dtype=PCM_DTYPE))
+            logger.info("Numba mel/SNR/level kernels compiled")
+
+        # Pre-planned real FFT over aligned, reused buffers (pyFFTW).
+        # Falls back to scipy.fft.rfft when pyFFTW is not installed.
+        # compute_stft windows int16 PCM straight into self._fft_in (float32).
+        self._fft = None
+        if pyfftw is not None:
+            self._fft_in = pyfftw.empty_aligned(n_fft, dtype='float32', n=32)
+            self._fft_out = pyfftw.empty_aligned(n_fft // 2 + 1, dtype='complex64', n=32)
+            self._load_fftw_wisdom()
+            self._fft = pyfftw.FFTW(
+                self._fft_in,
+                self._fft_out,
+                direction='FFTW_FORWARD',
+                flags=('FFTW_MEASURE', 'FFTW_DESTROY_INPUT'),
+                threads=1,
+            )
+            self._save_fftw_wisdom()
+            logger.info(f"FFTW plan ready: rfft N={n_fft} (float32)")
+        else:
+            self._fft_in = np.empty(n_fft, dtype=np.float32)
+            logger.info("pyFFTW not installed — using scipy.fft.rfft")
+
+        # Raw + clean in one batched transform (see compute_stft_pair),
+        # planned once here so the DSP thread never plans or writes wisdom
+        self._pair_in, self._pair_fft = self._plan_pair()
+
+    # ------------------------------------------------------------------
+    # FFTW wisdom persistence
+    # ------------------------------------------------------------------
+
+    def _load_fftw_wisdom(self):
+        """Import previously exported FFTW wisdom, if any"""
+        self._fftw_wisdom: tuple = ()
+        try:
+            with open(FFTW_WISDOM_PATH, 'r') as fp:
+                data = json.load(fp)
+            if not isinstance(data, list) or not all(isinstance(w, str) for w in data):
+                raise ValueError("wisdom file is not a list of strings")
+            pyfftw.import_wisdom(tuple(w.encode('ascii') for w in data))
+        except (OSError, ValueError, TypeError, IndexError) as e:
+            logger.debug(f"No FFTW wisdom loaded: {e}")
+        self._fftw_wisdom = pyfftw.export_wisdom()
+
+    def _save_fftw_wisdom(self):
+        """Export FFTW wisdom so the next startup skips planning — only if planning added any"""
+        wisdom = pyfftw.export_wisdom()
+        if wisdom == self._fftw_wisdom:
+            return
+        try:
+            with open(FFTW_WISDOM_PATH, 'w') as fp:
+                json.dump([w.decode('ascii') for w in wisdom], fp)
+            self._fftw_wisdom = wisdom
+        except OSError as e:
+            logger.warning(f"Could not save FFTW wisdom: {e}")
+
+    # ------------------------------------------------------------------
+    # Batched raw + clean FFT plan
+    # ------------------------------------------------------------------
+
+    def _plan_pair(self) -> PairPlan:
+        """Build the (input buffer, transform) pair for a (2, n_fft) raw + clean batch"""
+        n_freqs = self.n_fft // 2 + 1
+        if pyfftw is not None:
+            batch_in = pyfftw.empty_aligned((2, self.n_fft), dtype='float32', n=32)
+            batch_out = pyfftw.empty_aligned((2, n_freqs), dtype='complex64', n=32)
+            batch_fft = pyfftw.FFTW(
+                batch_in,
+                batch_out,
+                axes=(1,),
+                direction='FFTW_FORWARD',
+                flags=('FFTW_MEASURE', 'FFTW_DESTROY_INPUT'),
+                threads=1,
+            )
+            self._save_fftw_wisdom()
+        else:
+            batch_in = np.empty((2, self.n_fft), dtype=np.float32)
+            batch_fft = lambda: rfft(batch_in, axis=1, overwrite_x=True)
+        logger.info(f"Batched rfft ready: 2×{self.n_fft}")
+        return batch_in, batch_fft
+
     # ------------------------------------------------------------------
     # Mel filterbank helpers
     # ------------------------------------------------------------------
@@ -441,25 +822,24 @@ class AudioProcessingEngine:
 
         # n_mels + 2 evenly-spaced mel points (lower edge, n_mels centres, upper edge)
         mel_points = np.linspace(mel_min, mel_max, n_mels + 2)
-        hz_points = np.array([self._mel_to_hz(m) for m in mel_points])
+        hz_points = self._mel_to_hz(mel_points)
 
-        filterbank = np.zeros((n_mels, n_freqs), dtype=np.float32)
-        for m in range(n_mels):
-            f_left   = hz_points[m]       # left edge of triangle
-            f_center = hz_points[m + 1]   # peak
-            f_right  = hz_points[m + 2]   # right edge
+        # All triangles at once: rows are filters, columns are rfft bins
+        f_left   = hz_points[:-2, None]   # left edge of each triangle
+        f_center = hz_points[1:-1, None]  # peak
+        f_right  = hz_points[2:, None]    # right edge
 
-            rising  = (fft_freqs - f_left)  / (f_center - f_left)
-            falling = (f_right - fft_freqs) / (f_right  - f_center)
-            filterbank[m] = np.maximum(0.0, np.minimum(rising, falling))
+        rising  = (fft_freqs - f_left)  / (f_center - f_left)
+        falling = (f_right - fft_freqs) / (f_right  - f_center)
+        filterbank = np.maximum(0.0, np.minimum(rising, falling)).astype(np.float32)
 
-        return filterbank  # (n_mels, n_freqs)
+        return np.ascontiguousarray(filterbank)  # (n_mels, n_freqs)
 
     # ------------------------------------------------------------------
     # Mel spectrogram computation (Design Doc v1.2)
     # ------------------------------------------------------------------
 
-    def compute_mel_spectrogram(self, pcm_samples: List[int]) -> List[float]:
+    def compute_mel_spectrogram(self, pcm_samples: np.ndarray) -> np.ndarray:
         """
         Compute a single-frame log-mel energy vector from raw PCM samples.
 
@@ -477,67 +857,130 @@ class AudioProcessingEngine:
 
         Returns
         -------
-        List[float]
+        np.ndarray
             40 log-mel energy values in dB, clamped to [−80, 0].
         """
-        magnitude = self.compute_stft(pcm_samples)      # (n_fft//2 + 1,)
-        power = magnitude ** 2                           # power spectrum
+        return self.compute_mel_from_magnitude(self.compute_stft(pcm_samples))
+
+    def compute_mel_from_magnitude(self, magnitude: np.ndarray) -> np.ndarray:
+        """
+        Steps 2–6 of compute_mel_spectrogram on an existing rfft magnitude
+        vector (n_fft//2 + 1,), so a spectrum already computed for the
+        visualizer is not transformed a second time.
+
+        A (n_rows, n_fft//2 + 1) stack (e.g. raw + clean) goes through the
+        filterbank in one matmul and is peak-normalised per row → (n_rows, MEL_BINS).
+        """
+        if magnitude.ndim == 1:
+            power = np.square(magnitude, out=self._power)   # power spectrum
+        else:
+            power = np.square(magnitude, dtype=np.float32)
+
+        if _mel_db_kernel is not None:
+            # Steps 3–6 fused in one JIT kernel (fresh output: raw/clean both kept)
+            mel_db = np.empty(power.shape[:-1] + (MEL_BINS,), dtype=np.float32)
+            for row_power, row_out in zip(power.reshape(-1, power.shape[-1]), mel_db.reshape(-1, MEL_BINS)):
+                _mel_db_kernel(row_power, self._mel_filterbank, MEL_TOP_DB, row_out)
+            return mel_db
 
-        # Apply triangular mel filterbank  →  (MEL_BINS,)
-        mel_power = self._mel_filterbank @ power
+        # Apply triangular mel filterbank  →  (..., MEL_BINS) — the only allocation;
+        # every following step works in place on this array.
+        mel_db = power @ self._mel_filterbank.T
 
         # Convert power to dB (avoid log(0) with a small floor)
-        mel_power = np.maximum(mel_power, 1e-10)
-        mel_db = 10.0 * np.log10(mel_power)
+        np.maximum(mel_db, 1e-10, out=mel_db)
+        np.log10(mel_db, out=mel_db)
+        mel_db *= 10.0
 
         # Normalise so peak bin = 0 dB, then floor at −top_db
-        peak_db = float(mel_db.max())
-        mel_db = mel_db - peak_db           # range: (−∞, 0]
-        mel_db = np.maximum(mel_db, -MEL_TOP_DB)  # clamp floor to −80 dB
+        mel_db -= mel_db.max(axis=-1, keepdims=True)    # range: (−∞, 0]
+        np.maximum(mel_db, -MEL_TOP_DB, out=mel_db)     # clamp floor to −80 dB
 
-        return mel_db.tolist()
+        return mel_db
 
     # ------------------------------------------------------------------
-    # Existing DSP methods (unchanged)
+    # STFT, Bark band and SNR methods
     # ------------------------------------------------------------------
 
-    def compute_stft(self, pcm_samples: List[int]) -> np.ndarray:
-        """Compute STFT magnitude spectrum"""
-        if len(pcm_samples) < self.n_fft:
-            samples = np.pad(pcm_samples, (0, self.n_fft - len(pcm_samples)), mode='constant')
+    def _window_into(self, pcm_samples: np.ndarray, out: np.ndarray) -> None:
+        """Window the last n_fft samples into a float32 FFT input row (zero-padded if short)"""
+        pcm = np.asarray(pcm_samples)
+        n = len(pcm)
+        if n < self.n_fft:
+            out[:n] = pcm
+            out[n:] = 0.0
+            out *= self.window
         else:
             # Use last n_fft samples for real-time display
-            samples = np.array(pcm_samples[-self.n_fft:], dtype=np.float32)
-        windowed = samples * self.window
-        fft_result = rfft(windowed)
+            np.multiply(pcm[-self.n_fft:], self.window, out=out)
+
+    def compute_stft(self, pcm_samples: np.ndarray) -> np.ndarray:
+        """
+        Compute STFT magnitude spectrum.
+
+        int16 PCM is converted and windowed in a single pass straight into the
+        float32 FFT input buffer — no intermediate sample/windowed arrays.
+        """
+        self._window_into(pcm_samples, self._fft_in)
+        if self._fft is not None:
+            self._fft()
+            return np.abs(self._fft_out)
+        # The input buffer is refilled on every call, so scipy may clobber it
+        fft_result = rfft(self._fft_in, overwrite_x=True)
         magnitude = np.abs(fft_result)
         return magnitude
 
-    def compute_stft_with_freqs(self, pcm_samples: List[int]) -> tuple:
-        """Compute STFT and return with frequency bins"""
-        magnitude = self.compute_stft(pcm_samples)
-        freqs = np.fft.rfftfreq(self.n_fft, 1.0 / SAMPLE_RATE)
-        return magnitude, freqs
+    def compute_stft_pair(self, raw_pcm: np.ndarray, clean_pcm: np.ndarray) -> np.ndarray:
+        """
+        Raw and clean STFT magnitudes from one batched FFT over the last n_fft
+        samples of each channel. Returns a (2, n_fft//2 + 1) stack: row 0 raw,
+        row 1 clean — feed it straight to compute_bark_energies /
+        compute_mel_from_magnitude to keep both channels in one matmul.
 
-    def compute_bark_energies(self, spectrum: np.ndarray, freqs: np.ndarray) -> np.ndarray:
-        """Calculate energy in Bark frequency bands"""
-        magnitude_sq = spectrum ** 2
-        energies = np.zeros(self.n_bands)
+        Each channel is windowed straight from int16 into its row of the plan
+        buffer, with no stacked intermediate.
+        """
+        self._window_into(raw_pcm, self._pair_in[0])
+        self._window_into(clean_pcm, self._pair_in[1])
+        return np.abs(self._pair_fft())
+
+    @property
+    def rfft_freqs(self) -> np.ndarray:
+        """rfft bin frequencies (Hz) for n_fft at SAMPLE_RATE, read-only"""
+        return self._rfft_freqs
+
+    def compute_stft_with_freqs(self, pcm_samples: np.ndarray) -> tuple:
+        """Compute STFT and return with frequency bins"""
+        return self.compute_stft(pcm_samples), self._rfft_freqs
 
-        for i in range(self.n_bands):
-            mask = (freqs >= self.bark_edges[i]) & (freqs < self.bark_edges[i + 1])
-            if np.any(mask):
-                energies[i] = np.sum(magnitude_sq[mask])
+    def compute_bark_energies(self, spectrum: np.ndarray, freqs: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Calculate energy in Bark frequency bands.
 
+        `freqs` is ignored (bins are fixed by n_fft / SAMPLE_RATE and baked into
+        the band start indices); it is kept only for API compatibility.
+        Accepts one spectrum or a (n_rows, n_freqs) stack → (n_rows, n_bands).
+        """
+        magnitude_sq = np.square(spectrum, dtype=np.float32)
+        energies = np.add.reduceat(magnitude_sq, self._bark_starts, axis=-1)[..., :self.n_bands]
+        if self._bark_empty.any():
+            energies[..., self._bark_empty] = 0.0
         return energies
 
-    def compute_snr(self, raw_pcm: List[int], clean_pcm: List[int]) -> float:
+    def compute_snr(self, raw_pcm: np.ndarray, clean_pcm: np.ndarray) -> float:
         """Calculate SNR in dB"""
-        raw_array = np.array(raw_pcm, dtype=np.float64)
-        clean_array = np.array(clean_pcm, dtype=np.float64)
-        signal_power = np.mean(clean_array ** 2)
-        noise_array = raw_array - clean_array
-        noise_power = np.mean(noise_array ** 2)
+        if _snr_kernel is not None:
+            signal_energy, noise_energy = _snr_kernel(raw_pcm, clean_pcm)
+            signal_power = signal_energy / len(clean_pcm)
+            noise_power = noise_energy / len(clean_pcm)
+        else:
+            # int16 difference is exact in float32; energies via dot products
+            # (one SIMD pass each, no squared temporaries)
+            clean_array = clean_pcm.astype(np.float32)
+            noise_array = raw_pcm.astype(np.float32)
+            noise_array -= clean_array
+            signal_power = float(np.dot(clean_array, clean_array)) / len(clean_pcm)
+            noise_power = float(np.dot(noise_array, noise_array)) / len(clean_pcm)
         if noise_power < 1e-10:
             return 60.0
         snr_db = 10 * math.log10(signal_power / noise_power)
@@ -551,38 +994,111 @@ class AudioProcessingEngine:
 class BroadcastManager:
     def __init__(self):
         self.frontend_clients: Set[ServerConnection] = set()
-        self.client_versions: Dict[ServerConnection, str] = {}  # Track API version per client
-
-    def register(self, websocket: ServerConnection, version: str = "2"):
-        """Register client with API version preference"""
+        # Clients bucketed by payload so each payload is encoded and broadcast once
+        self._legacy_clients: Set[ServerConnection] = set()
+        self._v2_clients: Set[ServerConnection] = set()
+        self._binary_clients: Set[ServerConnection] = set()
+        # Clients currently skipped because their write buffer is backed up
+        self._slow_clients: Set[ServerConnection] = set()
+        # Batches skipped per client since it connected
+        self.dropped_frames: Dict[ServerConnection, int] = {}
+
+    def register(self, websocket: ServerConnection, version: str = "2", fmt: str = "json"):
+        """Register client with API version and wire format preference"""
+        if fmt == "binary" and msgpack is None:
+            logger.warning("Binary format requested but msgpack is not installed — using JSON")
+            fmt = "json"
         self.frontend_clients.add(websocket)
-        self.client_versions[websocket] = version
-        logger.info(f"Frontend client registered (API v{version}). Total: {len(self.frontend_clients)}")
+        self.dropped_frames[websocket] = 0
+        if fmt == "binary":
+            self._binary_clients.add(websocket)
+        elif version == "legacy" or version == "1":
+            self._legacy_clients.add(websocket)
+        else:
+            self._v2_clients.add(websocket)
+        logger.info(f"Frontend client registered (API v{version}, {fmt}). Total: {self.num_clients}")
 
     def unregister(self, websocket: ServerConnection):
         self.frontend_clients.discard(websocket)
-        self.client_versions.pop(websocket, None)
-        logger.info(f"Frontend client unregistered. Total: {len(self.frontend_clients)}")
+        self._legacy_clients.discard(websocket)
+        self._v2_clients.discard(websocket)
+        self._binary_clients.discard(websocket)
+        self._slow_clients.discard(websocket)
+        dropped = self.dropped_frames.pop(websocket, 0)
+        logger.info(f"Frontend client unregistered ({dropped} frames dropped). Total: {self.num_clients}")
+
+    @property
+    def has_clients(self) -> bool:
+        """True when at least one frontend is connected"""
+        return bool(self.frontend_clients)
+
+    @property
+    def num_clients(self) -> int:
+        """Number of connected frontends"""
+        return len(self.frontend_clients)
+
+    def _ready_clients(self, group: Set[ServerConnection]) -> List[ServerConnection]:
+        """
+        Clients of `group` that can take another frame.
+
+        websockets.broadcast applies no backpressure, so a client whose write
+        buffer exceeds SLOW_CLIENT_BUFFER_BYTES drops this batch instead of
+        queueing it; it rejoins once the buffer drains. Skipped batches are
+        counted per client in `dropped_frames`.
+        """
+        ready = []
+        for websocket in group:
+            transport = websocket.transport
+            if transport is not None and transport.get_write_buffer_size() > SLOW_CLIENT_BUFFER_BYTES:
+                self.dropped_frames[websocket] = self.dropped_frames.get(websocket, 0) + 1
+                if websocket not in self._slow_clients:
+                    self._slow_clients.add(websocket)
+                    logger.warning(f"Slow frontend client {websocket.remote_address}: dropping frames")
+                continue
+            if websocket in self._slow_clients:
+                self._slow_clients.discard(websocket)
+                logger.info(
+                    f"Frontend client {websocket.remote_address} caught up "
+                    f"({self.dropped_frames.get(websocket, 0)} frames dropped so far)"
+                )
+            ready.append(websocket)
+        return ready
 
     def broadcast_dto(self, dto_v2: VisualizationDTOv2):
         """Broadcast to all clients with version-appropriate formatting"""
-        if not self.frontend_clients:
+        if not self.has_clients:
             return
 
-        # Prepare both message formats
-        legacy_msg = json.dumps(dto_v2.to_legacy_dict())
-        v2_msg = json.dumps(dto_v2.to_v2_dict())
-
-        # Send appropriate version to each client
-        for client in self.frontend_clients:
-            version = self.client_versions.get(client, "2")
-            try:
-                if version == "legacy" or version == "1":
-                    websockets.broadcast({client}, legacy_msg)
-                else:
-                    websockets.broadcast({client}, v2_msg)
-            except Exception as e:
-                logger.warning(f"Failed to send to client: {e}")
+        # Encode each payload once, only if someone subscribes to it, and let
+        # websockets.broadcast fan the same frame out to the whole group.
+        # ndarrays are serialized without tolist(); binary clients get the v2 structure.
+        # The v2 dict is built at most once and shared by the JSON and msgpack encoders.
+        # Encoded sizes are logged at debug level to monitor bandwidth.
+        # Backed-up clients are filtered out first (see _ready_clients).
+        sizes: Dict[str, int] = {}
+        try:
+            v2_ready = self._ready_clients(self._v2_clients)
+            legacy_ready = self._ready_clients(self._legacy_clients)
+            binary_ready = self._ready_clients(self._binary_clients)
+            v2_dict = dto_v2.to_v2_dict() if (v2_ready or binary_ready) else None
+            if v2_ready:
+                message = encode_json(v2_dict)
+                websockets.broadcast(v2_ready, message, text=True)
+                sizes["v2"] = len(message)
+            if legacy_ready:
+                message = encode_json(dto_v2.to_legacy_dict())
+                websockets.broadcast(legacy_ready, message, text=True)
+                sizes["legacy"] = len(message)
+            if binary_ready:
+                message = encode_msgpack(dto_v2.to_binary_dict(v2_dict))
+                websockets.broadcast(binary_ready, message)
+                sizes["binary"] = len(message)
+        except Exception as e:
+            logger.warning(f"Failed to broadcast DTO: {e}")
+            return
+        # Guarded: the f-string would otherwise be built on every batch
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Broadcast batch {dto_v2.batchSeq}: {sizes} bytes")
 
 
 # ============================================================================
@@ -596,6 +1112,10 @@ class ESP32Handler:
         self.voice_logger = VoiceActivityLogger()
         self.last_batch_seq: Optional[int] = None
         self.packet_loss_count = 0
+        # Single DSP worker: the spectral pipeline runs off the event loop
+        # (FFT, matmul and the JIT kernels release the GIL) while batches stay
+        # in order and the engine's scratch buffers are never shared.
+        self._dsp_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="dsp")
 
     async def handle(self, websocket: ServerConnection):
         client_addr = websocket.remote_address
@@ -610,6 +1130,28 @@ class ESP32Handler:
         except Exception as e:
             logger.error(f"Error handling ESP32: {e}", exc_info=True)
 
+    def _compute_spectral(self, raw_pcm: np.ndarray, clean_pcm: np.ndarray) -> tuple:
+        """
+        Spectral pipeline for one batch (runs on the DSP worker).
+
+        Returns (2, n_freqs) magnitudes, (2, n_bands) Bark energies and
+        (2, MEL_BINS) log-mel dB — row 0 raw, row 1 clean.
+        """
+        # Raw and clean spectra from one batched FFT over the last n_fft
+        # samples of each channel
+        spectra = self.dsp_engine.compute_stft_pair(raw_pcm, clean_pcm)
+
+        # Bark band energies (both channels in one matmul)
+        bark = self.dsp_engine.compute_bark_energies(spectra)
+
+        # Mel spectrogram (Design Doc v1.2)
+        # Computed over the full 40 ms aggregated window (1920 samples).
+        # Reuses the FFT-512 magnitudes above (last 512 samples, equivalent to
+        # one full RNNoise frame) for a per-batch snapshot.
+        mel_db = self.dsp_engine.compute_mel_from_magnitude(spectra)
+
+        return spectra, bark, mel_db
+
     async def _process_binary_message(self, message: bytes):
         start_proc = time.perf_counter()
 
@@ -618,8 +1160,7 @@ class ESP32Handler:
             return
 
         # Parse header
-        header_data = message[:BATCH_HEADER_SIZE]
-        magic, version, reserved, batch_seq, timestamp_ms = struct.unpack(HEADER_FORMAT, header_data)
+        magic, version, reserved, batch_seq, timestamp_ms = HEADER_STRUCT.unpack_from(message, 0)
 
         if magic != MAGIC_NUMBER:
             logger.warning(f"Invalid magic: {hex(magic)}")
@@ -642,65 +1183,51 @@ class ESP32Handler:
         # Design Doc v1.2: Don't trust timestamp diff due to no NTP sync
         latency_ms = 63  # Budget: 40 + 3 + 5 + 10 + 5
 
-        # Parse frames
-        frames: List[AudioFrame] = []
-        for i in range(FRAMES_PER_BATCH):
-            offset = BATCH_HEADER_SIZE + (AUDIO_FRAME_SIZE * i)
-            frame_data = message[offset:offset + AUDIO_FRAME_SIZE]
-            try:
-                unpacked = struct.unpack(FRAME_FORMAT, frame_data)
-                frame_seq = unpacked[0]
-                vad_prob = unpacked[1]
-                rms_raw = unpacked[2]
-                raw_start = 3
-                clean_start = 3 + SAMPLES_PER_FRAME
-                raw_pcm = list(unpacked[raw_start:raw_start + SAMPLES_PER_FRAME])
-                clean_pcm = list(unpacked[clean_start:clean_start + SAMPLES_PER_FRAME])
-                frames.append(AudioFrame(frame_seq, vad_prob, rms_raw, raw_pcm, clean_pcm))
-            except struct.error as e:
-                logger.error(f"Frame parse error: {e}")
-                return
-
-        if not frames:
-            return
+        # Parse all frames at once — zero-copy structure-of-arrays views
+        frames = FramesBatch.from_packet(message)
 
-        # Aggregate data from all 4 frames (40ms window)
-        last_frame = frames[-1]
-        all_raw, all_clean = [], []
-        for f in frames:
-            all_raw.extend(f.raw_pcm)
-            all_clean.extend(f.clean_pcm)
+        # Aggregate data from all 4 frames (40ms window) — (4, 480) → 1920 samples
+        # (the clean channel is only aggregated once a frontend needs it)
+        raw_pcm = frames.raw.reshape(-1)
 
-        # DSP calculations
-        raw_spectrum, freqs = self.dsp_engine.compute_stft_with_freqs(all_raw)
-        clean_spectrum, _ = self.dsp_engine.compute_stft_with_freqs(all_clean)
-        snr = self.dsp_engine.compute_snr(last_frame.raw_pcm, last_frame.clean_pcm)
+        # Cheap per-batch metrics — always computed so the console log keeps running
+        snr = self.dsp_engine.compute_snr(frames.raw[-1], frames.clean[-1])
+        peak_raw, rms_db = self.voice_logger.calculate_levels(raw_pcm)
 
-        # Bark band energies
-        raw_bark = self.dsp_engine.compute_bark_energies(raw_spectrum, freqs)
-        clean_bark = self.dsp_engine.compute_bark_energies(clean_spectrum, freqs)
+        # No frontend subscribed: skip the spectral pipeline and DTO entirely
+        if not self.broadcast_manager.has_clients:
+            self.voice_logger.log_voice_activity(
+                batch_seq, frames, snr, packet_loss, 0,
+                peak=peak_raw, rms_db=rms_db
+            )
+            return
 
-        # Mel spectrogram (Design Doc v1.2)
-        # Computed over the full 40 ms aggregated window (1920 samples).
-        # The FFT-512 inside compute_mel_spectrogram uses the last 512 samples
-        # (equivalent to one full RNNoise frame) for a per-batch snapshot.
-        raw_mel_db  = self.dsp_engine.compute_mel_spectrogram(all_raw)
-        clean_mel_db = self.dsp_engine.compute_mel_spectrogram(all_clean)
+        clean_pcm = frames.clean.reshape(-1)
+
+        # DSP calculations on the worker thread; the event loop keeps serving
+        # frontend sockets meanwhile
+        loop = asyncio.get_running_loop()
+        spectra, bark, mel_db = await loop.run_in_executor(
+            self._dsp_executor, self._compute_spectral, raw_pcm, clean_pcm
+        )
+        raw_spectrum, clean_spectrum = spectra
+        raw_bark, clean_bark = bark
+        raw_mel_db, clean_mel_db = mel_db
+        freqs = self.dsp_engine.rfft_freqs
 
         # Aggregate metrics
-        mean_rms_raw = np.mean([f.rms_raw for f in frames])
-        max_vad = max(f.vad_prob for f in frames)
+        mean_rms_raw = frames.rms_raw.mean(dtype=np.float64)
+        max_vad = float(frames.vad_prob.max())
         server_proc_ms = (time.perf_counter() - start_proc) * 1000
 
         # Legacy metrics for compatibility
-        peak_raw = self.voice_logger.calculate_peak(all_raw)
-        rms_db = self.voice_logger.calculate_rms_db(all_raw)
         voice_detected = max_vad > 0.5
 
         # Log voice activity
         self.voice_logger.log_voice_activity(
             batch_seq, frames, snr, packet_loss,
-            len(self.broadcast_manager.frontend_clients)
+            self.broadcast_manager.num_clients,
+            peak=peak_raw, rms_db=rms_db
         )
 
         # Build enhanced DTO v2
@@ -716,24 +1243,24 @@ class ESP32Handler:
             connectionStatus="online",
 
             waveform=WaveformData(
-                raw=all_raw,
-                clean=all_clean,
+                raw=raw_pcm,
+                clean=clean_pcm,
                 sampleRate=SAMPLE_RATE,
                 durationMs=40
             ),
 
             spectrum=SpectrumData(
-                raw=raw_spectrum.tolist(),
-                clean=clean_spectrum.tolist(),
-                frequencies=freqs.tolist(),
+                raw=raw_spectrum,
+                clean=clean_spectrum,
+                frequencies=freqs,
                 fftSize=FFT_SIZE,
                 hopLength=HOP_LENGTH
             ),
 
             barkBands=BarkBandsData(
-                raw=raw_bark.tolist(),
-                clean=clean_bark.tolist(),
-                bandEdges=self.dsp_engine.bark_edges.tolist()
+                raw=raw_bark,
+                clean=clean_bark,
+                bandEdges=self.dsp_engine.bark_edges
             ),
 
             # v1.2: log-mel spectrogram — 40 bins, 20–8000 Hz, dB range −80 to 0
@@ -746,7 +1273,7 @@ class ESP32Handler:
             ),
 
             system=SystemMetrics(
-                frameSeq=last_frame.frame_seq,
+                frameSeq=int(frames.frame_seq[-1]),
                 serverProcessingMs=round(server_proc_ms, 2),
                 queueDepth=4
             ),
@@ -755,11 +1282,9 @@ class ESP32Handler:
             timestamp=time.time(),
             peak_raw=peak_raw,
             rms_db=rms_db,
-            voice_detected=voice_detected,
-            rawSpectrum=raw_spectrum.tolist(),
-            cleanSpectrum=clean_spectrum.tolist(),
-            rawWaveform=all_raw,
-            cleanWaveform=all_clean
+            voice_detected=voice_detected
+            # rawSpectrum/cleanSpectrum/rawWaveform/cleanWaveform are left empty:
+            # to_legacy_dict serves them from the nested spectrum/waveform arrays
         )
 
         # Broadcast to all clients (version-appropriate formatting)
@@ -770,12 +1295,12 @@ class FrontendHandler:
     def __init__(self, broadcast_manager: BroadcastManager):
         self.broadcast_manager = broadcast_manager
 
-    async def handle(self, websocket: ServerConnection, api_version: str = "2"):
-        """Handle visualizer client with version negotiation"""
+    async def handle(self, websocket: ServerConnection, api_version: str = "2", fmt: str = "json"):
+        """Handle visualizer client with version / format negotiation"""
         client_addr = websocket.remote_address
-        logger.info(f"🖥️  Frontend connected from {client_addr} (API v{api_version})")
+        logger.info(f"🖥️  Frontend connected from {client_addr} (API v{api_version}, {fmt})")
 
-        self.broadcast_manager.register(websocket, api_version)
+        self.broadcast_manager.register(websocket, api_version, fmt)
 
         try:
             await websocket.wait_closed()
@@ -799,42 +1324,46 @@ class AudioServer:
         self.frontend_handler = FrontendHandler(self.broadcast_manager)
 
     def _parse_path_version(self, path: str) -> tuple:
-        """Parse endpoint path and version query parameter"""
+        """Parse endpoint path plus version and format query parameters"""
         # Remove query string for path matching
         base_path = path.split('?')[0]
 
-        # Parse version from query string
+        # Parse version / format from query string
         version = "2"  # Default to v2
+        fmt = "json"   # Default to JSON text frames
         if '?' in path:
             query = path.split('?')[1]
             params = dict(p.split('=') for p in query.split('&') if '=' in p)
             version = params.get('version', '2')
+            fmt = params.get('format', 'json')
 
         # Legacy endpoint mapping
         if base_path == "/visualizer-legacy" or base_path == "/visualizer/v1":
             version = "legacy"
             base_path = "/visualizer"
 
-        return base_path, version
+        return base_path, version, fmt
 
     async def route_connection(self, websocket: ServerConnection):
         """Route connections to appropriate handlers"""
         raw_path = websocket.request.path if hasattr(websocket, 'request') else '/'
-        path, version = self._parse_path_version(raw_path)
+        path, version, fmt = self._parse_path_version(raw_path)
 
         if path == "/esp32" or path == "/":
             await self.esp32_handler.handle(websocket)
         elif path == "/visualizer":
-            await self.frontend_handler.handle(websocket, version)
+            await self.frontend_handler.handle(websocket, version, fmt)
         else:
             await websocket.close(code=1000, reason=f"Unknown endpoint: {path}")
 
     async def start(self):
         logger.info(f"Server starting on ws://{self.host}:{self.port}")
+        logger.info(f"  Event loop: {type(asyncio.get_running_loop()).__module__}")
         logger.info(f"  ESP32:      ws://{self.host}:{self.port}/esp32")
         logger.info(f"  Visualizer: ws://{self.host}:{self.port}/visualizer")
         logger.info(f"  Legacy:     ws://{self.host}:{self.port}/visualizer?version=legacy")
         logger.info(f"  Legacy Alt: ws://{self.host}:{self.port}/visualizer-legacy")
+        logger.info(f"  Binary:     ws://{self.host}:{self.port}/visualizer?format=binary")
         logger.info("\n MIC TEST READY: Speak near the microphone to see volume bars!\n")
 
         server = await serve(
@@ -842,7 +1371,15 @@ class AudioServer:
             self.host,
             self.port,
             ping_interval=20,
-            ping_timeout=10
+            ping_timeout=10,
+            # permessage-deflate costs more CPU per broadcast than it saves on
+            # a LAN, and numeric payloads compress poorly — send frames as-is
+            compression=None,
+            # Inbound traffic is ESP32 batches (EXPECTED_PACKET_SIZE) and tiny
+            # control messages: cap frame size well below the 1 MiB default and
+            # keep at most ~320 ms of unread batches before TCP backpressure.
+            max_size=8 * EXPECTED_PACKET_SIZE,
+            max_queue=8,
         )
         await server.serve_forever()
 
@@ -857,6 +1394,9 @@ async def main():
 
 if __name__ == "__main__":
     try:
-        asyncio.run(main())
+        if uvloop is not None:
+            uvloop.run(main())
+        else:
+            asyncio.run(main())
     except KeyboardInterrupt:
         logger.info("\nServer stopped")